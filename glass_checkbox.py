@@ -1,27 +1,98 @@
 #!/usr/bin/env python3
 """
 Custom Checkbox Widget for TimeRing
-Provides a glass-style checkbox with proper tick marks using Unicode symbols
+Provides a glass-style checkbox with crisp vector tick marks
 """
 
-from PyQt5.QtWidgets import QCheckBox
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QFont, QColor, QPen, QBrush, QLinearGradient
+import sys
+
+from PyQt5.QtWidgets import QCheckBox, QStyle, QStyleOptionButton
+from PyQt5.QtCore import Qt, QRect, QEvent, QPoint, QPointF
+from PyQt5.QtGui import (QPainter, QColor, QPen, QBrush, QLinearGradient, QPixmap,
+                         QPixmapCache, QPainterPath, QTransform)
+
+# Pre-built paint resources keyed by (theme, checked). Gradients depend on the
+# indicator geometry, so only their stop colors are cached here.
+_CHECK_PEN = QPen(QColor(255, 255, 255), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+_TEXT_PENS = {
+    "light": QPen(QColor(29, 29, 31)),
+    "dark": QPen(QColor(245, 245, 247)),
+}
+_PALETTE = {
+    ("light", False): {
+        "bg_brush": QBrush(QColor(255, 255, 255, 51)),  # rgba(255, 255, 255, 0.2)
+        "border_pen": QPen(QColor(255, 255, 255, 102), 2),  # rgba(255, 255, 255, 0.4)
+        "text_pen": _TEXT_PENS["light"],
+    },
+    ("light", True): {
+        "stop0": QColor(60, 101, 160, 229),  # rgba(60, 101, 160, 0.9)
+        "stop1": QColor(92, 170, 197, 229),  # rgba(92, 170, 197, 0.9)
+        "border_pen": QPen(QColor(60, 101, 160, 204), 2),  # rgba(60, 101, 160, 0.8)
+        "text_pen": _TEXT_PENS["light"],
+    },
+    ("dark", False): {
+        "bg_brush": QBrush(QColor(45, 55, 72, 102)),  # rgba(45, 55, 72, 0.4)
+        "border_pen": QPen(QColor(255, 255, 255, 51), 2),  # rgba(255, 255, 255, 0.2)
+        "text_pen": _TEXT_PENS["dark"],
+    },
+    ("dark", True): {
+        "stop0": QColor(92, 170, 197, 229),  # rgba(92, 170, 197, 0.9)
+        "stop1": QColor(92, 205, 213, 229),  # rgba(92, 205, 213, 0.9)
+        "border_pen": QPen(QColor(92, 170, 197, 204), 2),  # rgba(92, 170, 197, 0.8)
+        "text_pen": _TEXT_PENS["dark"],
+    },
+}
+
+# Style option state bits for the unchecked/checked indicator
+_CHECK_STATE = {False: QStyle.State_Off, True: QStyle.State_On}
+_CHECK_STATE_MASK = QStyle.State_On | QStyle.State_Off
+
+# Checkmark in unit coordinates, scaled to the indicator size when rendered
+_CHECK_PATH = QPainterPath()
+_CHECK_PATH.moveTo(0.25, 0.55)
+_CHECK_PATH.lineTo(0.45, 0.75)
+_CHECK_PATH.lineTo(0.80, 0.30)
+
+# Hash-consed assets shared by every GlassCheckBox instance
+_SHARED_BRUSHES = {}  # (theme, width, height) -> gradient QBrush at the origin
+_ROUNDED_PATHS = {}  # (width, height, radius) -> QPainterPath at the origin
+# Checkmark pixmaps live in QPixmapCache so they count against Qt's budget
+
+
+def _shared(table, key, factory):
+    """Return the shared asset for key, building it on first use"""
+    asset = table.get(key)
+    if asset is None:
+        asset = table.setdefault(key, factory())
+    return asset
+
+
+def _make_rounded_path(width, height, radius):
+    path = QPainterPath()
+    path.addRoundedRect(0, 0, width, height, radius, radius)
+    return path
+
+
+def _make_gradient_brush(palette, width, height):
+    gradient = QLinearGradient(QPointF(0, 0), QPointF(width, height))
+    gradient.setColorAt(0, palette["stop0"])
+    gradient.setColorAt(1, palette["stop1"])
+    return QBrush(gradient)
+
 
 class GlassCheckBox(QCheckBox):
-    """Custom checkbox with glass styling and Unicode tick marks"""
+    """Custom checkbox with glass styling and vector tick marks"""
     
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
+        self._is_dark = False
+        
+        # Only geometry lives in QSS; colors are painted in paintEvent, so
+        # theme flips don't need a style sheet re-polish
         self.setStyleSheet("""
             QCheckBox {
                 font-weight: 500;
                 spacing: 8px;
-                color: #1D1D1F;
-            }
-            
-            QCheckBox[darkTheme="true"] {
-                color: #F5F5F7;
             }
             
             QCheckBox::indicator {
@@ -30,85 +101,174 @@ class GlassCheckBox(QCheckBox):
                 border-radius: 8px;
             }
         """)
+        
+        # Cached style option and indicator rect, rebuilt only when stale
+        self._opt = QStyleOptionButton()
+        self._opt.initFrom(self)
+        self._opt.text = text
+        self._indicator_rect = None
+        self._text_rect = None
+        self._last_checked = None
+        self._check_pm = None
+        self._check_offset = None
+        self._gradient_brush = None
+    
+    def setText(self, text):
+        """Set the label text and invalidate the cached geometry"""
+        super().setText(text)
+        self._opt.text = text
+        self._indicator_rect = None
+        self._text_rect = None
+        self._check_pm = None
+        self._gradient_brush = None
+    
+    def setDarkTheme(self, is_dark):
+        """Switch between light and dark painting"""
+        is_dark = bool(is_dark)
+        if is_dark != self._is_dark:
+            self._is_dark = is_dark
+            self._gradient_brush = None
+            self.update()
+    
+    def setProperty(self, name, value):
+        """Set a property, routing darkTheme through setDarkTheme"""
+        result = super().setProperty(name, value)
+        if name == "darkTheme":
+            self.setDarkTheme(value == True)
+        return result
+    
+    def changeEvent(self, event):
+        """Resync the cached theme when the style changes externally"""
+        if event.type() == QEvent.StyleChange:
+            is_dark = self.property("darkTheme")
+            if is_dark is not None:
+                self.setDarkTheme(is_dark == True)
+        super().changeEvent(event)
+    
+    def resizeEvent(self, event):
+        self._indicator_rect = None
+        self._text_rect = None
+        self._check_pm = None
+        self._gradient_brush = None
+        super().resizeEvent(event)
+    
+    def showEvent(self, event):
+        self._indicator_rect = None
+        self._text_rect = None
+        self._check_pm = None
+        self._gradient_brush = None
+        super().showEvent(event)
+    
+    def indicatorRect(self):
+        """Return the cached indicator rect, recomputing it only when stale"""
+        checked = self.isChecked()
+        if self._indicator_rect is None:
+            # initFrom resets the geometry and state of the cached option
+            self._opt.initFrom(self)
+            self._opt.state = QStyle.State_Enabled | _CHECK_STATE[checked]
+            self._last_checked = checked
+            self._indicator_rect = self.style().subElementRect(
+                QStyle.SE_CheckBoxIndicator, self._opt, self
+            )
+        elif checked != self._last_checked:
+            # Only touch the state bits when the check state actually changed
+            self._opt.state = self._opt.state & ~_CHECK_STATE_MASK | _CHECK_STATE[checked]
+            self._last_checked = checked
+        return self._indicator_rect
+    
+    def textRect(self):
+        """Return the cached label rect to the right of the indicator"""
+        if self._text_rect is None:
+            left = self.indicatorRect().right() + 8  # 8px spacing
+            self._text_rect = QRect(left, 0, self.width() - left, self.height())
+        return self._text_rect
+    
+    def checkPixmap(self, rect):
+        """Return the pre-rendered checkmark for the indicator rect"""
+        dpr = self.devicePixelRatioF()
+        key = f"glasscb_checkpath_{rect.width()}x{rect.height()}_{dpr}_{_CHECK_PEN.color().rgba()}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(rect.width() * dpr), round(rect.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(_CHECK_PEN)
+            painter.drawPath(QTransform.fromScale(rect.width(), rect.height()).map(_CHECK_PATH))
+            painter.end()
+            
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
     
     def paintEvent(self, event):
-        """Custom paint event to draw glass checkbox with Unicode tick"""
+        """Custom paint event to draw glass checkbox with a vector tick"""
+        # Nothing to do when the widget is scrolled out of view or clipped
+        visible = self.visibleRegion()
+        if visible.isEmpty() or not visible.intersects(event.rect()):
+            return
+        
+        # Get checkbox rect
+        rect = self.indicatorRect()
+        
+        # Only repaint the parts covered by the exposed region; the 2px
+        # border pen reaches 1px outside the indicator rect
+        region = event.region()
+        draw_indicator = region.intersects(rect.adjusted(-1, -1, 1, 1))
+        draw_text = bool(self.text()) and region.intersects(self.textRect())
+        if not draw_indicator and not draw_text:
+            return
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Get checkbox rect
-        option = self.styleOption()
-        rect = self.style().subElementRect(self.style().SE_CheckBoxIndicator, option, self)
-        
-        # Determine if dark theme
-        is_dark = self.property("darkTheme") == True
-        
-        # Draw background
-        if is_dark:
-            bg_color = QColor(45, 55, 72, 102)  # rgba(45, 55, 72, 0.4)
-            border_color = QColor(255, 255, 255, 51)  # rgba(255, 255, 255, 0.2)
-        else:
-            bg_color = QColor(255, 255, 255, 51)  # rgba(255, 255, 255, 0.2)
-            border_color = QColor(255, 255, 255, 102)  # rgba(255, 255, 255, 0.4)
-        
-        # Create gradient for checked state
-        if self.isChecked():
-            gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
-            if is_dark:
-                gradient.setColorAt(0, QColor(92, 170, 197, 229))  # rgba(92, 170, 197, 0.9)
-                gradient.setColorAt(1, QColor(92, 205, 213, 229))  # rgba(92, 205, 213, 0.9)
-                border_color = QColor(92, 170, 197, 204)  # rgba(92, 170, 197, 0.8)
+        # Select pre-built resources for the current theme
+        palette = _PALETTE[("dark" if self._is_dark else "light", self.isChecked())]
+        
+        if draw_indicator:
+            # Draw background
+            if self.isChecked():
+                if self._gradient_brush is None:
+                    theme = "dark" if self._is_dark else "light"
+                    key = (theme, rect.width(), rect.height())
+                    self._gradient_brush = _shared(
+                        _SHARED_BRUSHES, key, lambda: _make_gradient_brush(palette, *key[1:])
+                    )
+                painter.setBrush(self._gradient_brush)
             else:
-                gradient.setColorAt(0, QColor(60, 101, 160, 229))  # rgba(60, 101, 160, 0.9)
-                gradient.setColorAt(1, QColor(92, 170, 197, 229))  # rgba(92, 170, 197, 0.9)
-                border_color = QColor(60, 101, 160, 204)  # rgba(60, 101, 160, 0.8)
+                painter.setBrush(palette["bg_brush"])
             
-            painter.setBrush(QBrush(gradient))
-        else:
-            painter.setBrush(QBrush(bg_color))
-        
-        # Draw border
-        pen = QPen(border_color, 2)
-        painter.setPen(pen)
-        
-        # Draw rounded rectangle
-        painter.drawRoundedRect(rect, 8, 8)
-        
-        # Draw checkmark if checked
-        if self.isChecked():
-            painter.setPen(QPen(QColor(255, 255, 255), 2))
-            font = QFont()
-            font.setPixelSize(14)
-            font.setBold(True)
-            painter.setFont(font)
+            # Draw border
+            painter.setPen(palette["border_pen"])
             
-            # Draw Unicode checkmark
-            painter.drawText(rect, Qt.AlignCenter, "✓")
+            # Draw rounded rectangle from the cached path for this size
+            key = (rect.width(), rect.height(), 8)
+            path = _shared(_ROUNDED_PATHS, key, lambda: _make_rounded_path(*key))
+            painter.save()
+            painter.translate(rect.topLeft())
+            painter.drawPath(path)
+            painter.restore()
+            
+            # Draw checkmark if checked
+            if self.isChecked():
+                if self._check_pm is None:
+                    self._check_pm = self.checkPixmap(rect)
+                    dpr = self._check_pm.devicePixelRatio()
+                    self._check_offset = rect.topLeft() + QPoint(
+                        (rect.width() - round(self._check_pm.width() / dpr)) // 2,
+                        (rect.height() - round(self._check_pm.height() / dpr)) // 2,
+                    )
+                painter.drawPixmap(self._check_offset, self._check_pm)
         
         # Draw the text
-        if self.text():
-            text_rect = self.rect()
-            text_rect.setLeft(rect.right() + 8)  # 8px spacing
-            painter.setPen(QPen(QColor(29, 29, 31) if not is_dark else QColor(245, 245, 247)))
-            painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, self.text())
-    
-    def styleOption(self):
-        """Get style option for the checkbox"""
-        from PyQt5.QtWidgets import QStyleOptionButton
-        option = QStyleOptionButton()
-        option.initFrom(self)
-        option.text = self.text()
-        option.state = self.style().State_Enabled
-        if self.isChecked():
-            option.state |= self.style().State_On
-        else:
-            option.state |= self.style().State_Off
-        return option
+        if draw_text:
+            painter.setPen(palette["text_pen"])
+            painter.drawText(self.textRect(), Qt.AlignVCenter | Qt.AlignLeft, self.text())
 
 
-def apply_glass_checkbox_style():
-    """Apply the glass checkbox style globally"""
-    return """
+# Global glass checkbox style sheet, built once at import
+_GLASS_CHECKBOX_QSS = sys.intern("""
         /* Enhanced Checkbox with Unicode Checkmarks */
         QCheckBox {
             font-weight: 500;
@@ -167,12 +327,16 @@ def apply_glass_checkbox_style():
                                        stop:1 rgba(92, 205, 213, 0.9));
             border: 2px solid rgba(92, 170, 197, 0.8);
         }
-    """
+    """)
+
+
+def apply_glass_checkbox_style():
+    """Apply the glass checkbox style globally"""
+    return _GLASS_CHECKBOX_QSS
 
 
 if __name__ == "__main__":
     # Test the custom checkbox
-    import sys
     from PyQt5.QtWidgets import QApplication, QVBoxLayout, QWidget
     
     app = QApplication(sys.argv)
@@ -184,7 +348,7 @@ if __name__ == "__main__":
     # Add custom checkboxes
     cb1 = GlassCheckBox("Light theme checkbox")
     cb2 = GlassCheckBox("Dark theme checkbox")
-    cb2.setProperty("darkTheme", True)
+    cb2.setDarkTheme(True)
     cb2.setChecked(True)
     
     layout.addWidget(cb1)
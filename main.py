@@ -1,31 +1,175 @@
 import sys
 import json
 import os
+import re
 import subprocess
 import threading
 import time
-import argparse
-import webbrowser
+import functools
+import heapq
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,
                              QLineEdit, QPushButton, QListWidget, QListWidgetItem,
-                             QHBoxLayout, QLabel, QTextEdit, QDialog, QDialogButtonBox,
-                             QFileDialog, QGroupBox, QCheckBox, QTabWidget, QComboBox,
-                             QFrame, QScrollArea, QSizePolicy, QSpacerItem, QGridLayout,
-                             QMessageBox, QDesktopWidget)
-from PyQt5.QtCore import QTimer, Qt, QPropertyAnimation, QRect, QEasingCurve, pyqtSignal, QSettings
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QPalette, QPainter, QColor, QTransform
-from PyQt5.QtSvg import QSvgRenderer
-import vlc
-import requests
+                             QHBoxLayout, QLabel, QTextEdit, QTextBrowser, QDialog, QDialogButtonBox,
+                             QFileDialog, QGroupBox, QTabWidget, QComboBox,
+                             QFrame, QScrollArea, QSizePolicy, QGridLayout,
+                             QMessageBox)
+from PyQt5.QtCore import QTimer, Qt, QThread, QMutex, QWaitCondition, QMetaType, QEvent, QUrl, pyqtSlot
+from PyQt5.QtGui import QIcon, QPixmap, QPalette, QPainter, QTransform, QTextDocument, QIntValidator
 from version import get_version
 
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """orjson if installed, else None; imported on first use since it pulls in datetime/uuid/zoneinfo"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps(obj, indent=False):
+    """Encode obj as JSON bytes, indented if asked; orjson is much faster than json when available"""
+    orjson = _orjson()
+    if orjson is not None:
+        # orjson only indents by two spaces
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=4 if indent else None).encode("utf-8")
+
+
+def _loads(data):
+    """Decode JSON bytes, with orjson when available"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Application metadata
 APP_NAME = "TimeRing"
 APP_VERSION = get_version()
 APP_DEVELOPER = "Lusan Sapkota"
 
+# Install directory holding style.qss, sounds/ and images/; resolved once at import
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+_STYLE_PATH = os.path.join(_APP_DIR, "style.qss")
+
+# One player shared by every sound preview: a QMediaPlayer, or a libvlc
+# player when QtMultimedia has no usable backend (_vlc_instance is then set)
+_vlc_instance = None
+_preview_player = None
+_preview_path = None
+
+
+def _new_qt_preview_player():
+    """Return a QMediaPlayer for previews, or None if QtMultimedia can't play here"""
+    try:
+        from PyQt5.QtMultimedia import QMediaPlayer
+    except ImportError:
+        return None
+    
+    # Owned by the application so it's destroyed before QApplication is
+    player = QMediaPlayer(QApplication.instance())
+    if player.isAvailable():
+        return player
+    player.deleteLater()
+    return None
+
+
+def get_preview_player():
+    """Return the shared preview player, creating it on first use"""
+    global _vlc_instance, _preview_player
+    if _preview_player is None:
+        # QtMultimedia plays through the platform media framework, so libvlc
+        # and its plugin set are only loaded when that isn't available
+        _preview_player = _new_qt_preview_player()
+        if _preview_player is None:
+            import vlc
+            _vlc_instance = vlc.Instance("--no-video", "--quiet")
+            _preview_player = _vlc_instance.media_player_new()
+    return _preview_player
+
+
+def play_preview(path):
+    """Play path on the shared preview player and return the player"""
+    global _preview_path
+    player = get_preview_player()
+    use_vlc = _vlc_instance is not None
+    
+    # Repeated clicks on a preview that's still playing are no-ops
+    if use_vlc:
+        is_playing = player.is_playing()
+    else:
+        is_playing = player.state() == player.PlayingState
+    if path == _preview_path and is_playing:
+        return player
+    
+    player.stop()
+    # Keep the loaded media when replaying the same file
+    if path != _preview_path:
+        if use_vlc:
+            player.set_mrl(path)
+        else:
+            from PyQt5.QtMultimedia import QMediaContent
+            player.setMedia(QMediaContent(QUrl.fromLocalFile(path)))
+        _preview_path = path
+    player.play()
+    return player
+
+
+def _atomic_write(path, data, fsync=False):
+    """Write bytes to path via a temp file so a crash never leaves it truncated"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# Notification urgency names mapped to the freedesktop "urgency" hint byte
+_URGENCY_LEVELS = {"low": 0, "normal": 1, "critical": 2}
+
+# notify-send children still running; finished ones are reaped on the next send
+_NOTIFY_PROCS = []
+
+
+def send_notification(summary, body, urgency="normal"):
+    """Show a desktop notification over the session bus, or notify-send without one"""
+    from PyQt5.QtDBus import QDBusConnection, QDBusMessage, QDBusArgument
+    bus = QDBusConnection.sessionBus()
+    if bus.isConnected():
+        message = QDBusMessage.createMethodCall(
+            "org.freedesktop.Notifications", "/org/freedesktop/Notifications",
+            "org.freedesktop.Notifications", "Notify")
+        message.setArguments([
+            APP_NAME,
+            QDBusArgument(0, QMetaType.UInt),  # replaces_id
+            "",  # app_icon
+            summary,
+            body,
+            QDBusArgument([], QMetaType.QStringList),  # actions
+            {"urgency": QDBusArgument(_URGENCY_LEVELS.get(urgency, 1), QMetaType.UChar)},
+            -1,  # expire_timeout: server default
+        ])
+        # Fire and forget; the GUI thread never waits on the notification daemon
+        bus.send(message)
+        return
+    
+    _NOTIFY_PROCS[:] = [proc for proc in _NOTIFY_PROCS if proc.poll() is None]
+    try:
+        _NOTIFY_PROCS.append(subprocess.Popen(
+            ["notify-send", "--urgency=" + urgency, summary, body],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            close_fds=True))
+    except OSError as e:
+        print(f"Error sending notification: {e}")
+
+
 class TimerEditDialog(QDialog):
     def __init__(self, name="", description="", parent=None):
         super().__init__(parent)
@@ -53,8 +197,26 @@ class TimerEditDialog(QDialog):
     def get_data(self):
         return self.name_edit.text().strip(), self.description_edit.toPlainText().strip()
 
+# Cached result of detect_system_theme(); None until first detection
+_THEME_CACHE = None
+
+
+def invalidate_theme_cache():
+    """Forget the cached theme so the next lookup re-detects it"""
+    global _THEME_CACHE
+    _THEME_CACHE = None
+
+
 def detect_system_theme():
-    """Detect if the system is using dark theme"""
+    """Detect if the system is using dark theme (cached after the first call)"""
+    global _THEME_CACHE
+    if _THEME_CACHE is None:
+        _THEME_CACHE = _detect_system_theme()
+    return _THEME_CACHE
+
+
+def _detect_system_theme():
+    """Query the palette and desktop settings for the current theme"""
     try:
         # Try to detect theme using Qt's palette
         app = QApplication.instance()
@@ -74,17 +236,17 @@ def detect_system_theme():
         desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
         if 'gnome' in desktop:
             try:
-                result = subprocess.run(['gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme'], 
-                                      capture_output=True, text=True, timeout=2)
-                return 'dark' in result.stdout.lower()
+                # color-scheme: 1 prefers dark, 2 prefers light, 0 no preference
+                scheme = _read_portal_setting('org.freedesktop.appearance', 'color-scheme')
+                if scheme in (1, 2):
+                    return scheme == 1
+                return 'dark' in _read_gnome_gtk_theme().lower()
             except:
                 pass
         elif 'kde' in desktop:
             try:
                 # Check KDE theme
-                result = subprocess.run(['kreadconfig5', '--group', 'General', '--key', 'ColorScheme'], 
-                                      capture_output=True, text=True, timeout=2)
-                return 'dark' in result.stdout.lower()
+                return 'dark' in _read_kde_color_scheme().lower()
             except:
                 pass
     except:
@@ -92,6 +254,47 @@ def detect_system_theme():
     
     return False  # Default to light theme
 
+def _read_portal_setting(namespace, key):
+    """Read a desktop setting from xdg-desktop-portal over the session bus; None if unavailable"""
+    from PyQt5.QtDBus import QDBus, QDBusConnection, QDBusMessage, QDBusVariant
+    bus = QDBusConnection.sessionBus()
+    if not bus.isConnected():
+        return None
+    message = QDBusMessage.createMethodCall(
+        "org.freedesktop.portal.Desktop", "/org/freedesktop/portal/desktop",
+        "org.freedesktop.portal.Settings", "Read")
+    message.setArguments([namespace, key])
+    reply = bus.call(message, QDBus.Block, 500)
+    if reply.type() != QDBusMessage.ReplyMessage or not reply.arguments():
+        return None
+    value = reply.arguments()[0]
+    # Read wraps the setting in a variant, and older portals wrap it twice
+    while isinstance(value, QDBusVariant):
+        value = value.variant()
+    return value
+
+
+def _read_gnome_gtk_theme():
+    """Read the GNOME gtk-theme in-process via Gio, falling back to the settings portal"""
+    try:
+        from gi.repository import Gio
+        source = Gio.SettingsSchemaSource.get_default()
+        # Gio.Settings.new() aborts the process if the schema is missing
+        if source and source.lookup('org.gnome.desktop.interface', True):
+            return Gio.Settings.new('org.gnome.desktop.interface').get_string('gtk-theme')
+    except ImportError:
+        pass
+    return _read_portal_setting('org.gnome.desktop.interface', 'gtk-theme') or ""
+
+
+def _read_kde_color_scheme():
+    """Read the KDE ColorScheme from kdeglobals without spawning kreadconfig5"""
+    import configparser
+    config_home = os.environ.get('XDG_CONFIG_HOME') or os.path.join(Path.home(), '.config')
+    parser = configparser.ConfigParser(interpolation=None, strict=False)
+    parser.read(os.path.join(config_home, 'kdeglobals'), encoding='utf-8')
+    return parser.get('General', 'ColorScheme', fallback='')
+
 def get_status_icon(self, status):
     if status == "running":
         return self.get_icon("status_running")
@@ -102,32 +305,47 @@ def get_status_icon(self, status):
     else:
         return QIcon()  # fallback
 
-def apply_theme_to_widget(widget, is_dark=None):
-    """Apply theme property to widget and its children"""
+def apply_theme_to_widget(widget, is_dark=None, descendants=False):
+    """Apply theme property to widget, and to all its descendants in one pass if asked"""
     if is_dark is None:
         is_dark = detect_system_theme()
     
-    widget.setProperty("darkTheme", is_dark)
-    
-    # Apply to all child widgets recursively
-    for child in widget.findChildren(QWidget):
-        child.setProperty("darkTheme", is_dark)
-    
-    # Refresh styles
-    widget.style().unpolish(widget)
-    widget.style().polish(widget)
-    
-    # Force refresh for all children
-    for child in widget.findChildren(QWidget):
-        child.style().unpolish(child)
-        child.style().polish(child)
+    # Children normally pick up the theme through `QWidget[darkTheme="true"] ...`
+    # descendant selectors, so only the root needs the property; Qt's own
+    # dialogs are styled per widget and ask for the whole subtree
+    widgets = (widget, *widget.findChildren(QWidget)) if descendants else (widget,)
+    for w in widgets:
+        w.setProperty("darkTheme", is_dark)
+        
+        # Widgets that haven't been shown yet pick the property up when Qt
+        # polishes them on first show; only re-polish ones already styled
+        if w.testAttribute(Qt.WA_WState_Polished):
+            w.style().unpolish(w)
+            w.style().polish(w)
     
     # Force repaint
     widget.update()
 
 
+def set_status_property(widget, status):
+    """Restyle widget through the QSS rules for its status; re-polishes only on change"""
+    if widget.property("status") != status:
+        widget.setProperty("status", status)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
 def parse_arguments():
     """Parse command line arguments"""
+    # Plain launches and --version don't need a full ArgumentParser
+    argv = sys.argv[1:]
+    if not argv:
+        return SimpleNamespace(set_sound=None)
+    if argv == ['--version']:
+        print(f'{APP_NAME} {APP_VERSION}\nDeveloper: {APP_DEVELOPER}')
+        sys.exit(0)
+    
+    import argparse
     parser = argparse.ArgumentParser(
         description=f"{APP_NAME} - A lightweight desktop timer application",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -168,8 +386,8 @@ class SettingsModalDialog(QDialog):
         self.resize(500, 400)
         
         # Apply theme before setting up UI
-        is_dark = detect_system_theme()
-        apply_theme_to_widget(self, is_dark)
+        self._is_dark = detect_system_theme()
+        apply_theme_to_widget(self, self._is_dark)
         
         self.setup_ui()
         
@@ -258,8 +476,8 @@ class SettingsModalDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
         
-        # Media player for preview
-        self.preview_player = vlc.MediaPlayer()
+        # Shared preview player, acquired on first preview
+        self.preview_player = None
 
     def browse_sound(self):
         """Browse for sound file"""
@@ -267,20 +485,9 @@ class SettingsModalDialog(QDialog):
         file_dialog.setNameFilter("Audio Files (*.mp3 *.wav *.ogg *.m4a)")
         file_dialog.setWindowTitle("Select Default Sound")
         
-        # Apply theme to file dialog
-        is_dark = detect_system_theme()
-        apply_theme_to_widget(file_dialog, is_dark)
-        
-        # Force theme application to all child widgets after showing
-        file_dialog.show()
-        
-        # Apply theme recursively to all child widgets
-        for child in file_dialog.findChildren(QWidget):
-            apply_theme_to_widget(child, is_dark)
-        
-        # Force style refresh
-        file_dialog.style().unpolish(file_dialog)
-        file_dialog.style().polish(file_dialog)
+        # Theme the file dialog and its children before exec_() shows it,
+        # so each widget is polished once with the property already set
+        apply_theme_to_widget(file_dialog, detect_system_theme(), descendants=True)
         
         if file_dialog.exec_() == QFileDialog.Accepted:
             sound_path = file_dialog.selectedFiles()[0]
@@ -293,10 +500,7 @@ class SettingsModalDialog(QDialog):
             sound_path = self.parent_window.alarm_sound if self.parent_window else ""
             
         if sound_path and os.path.exists(sound_path):
-            if self.preview_player:
-                self.preview_player.stop()
-                self.preview_player.set_mrl(sound_path)
-                self.preview_player.play()
+            self.preview_player = play_preview(sound_path)
     
     def reset_sound(self):
         """Reset to default sound"""
@@ -305,10 +509,10 @@ class SettingsModalDialog(QDialog):
     def open_advanced_settings(self):
         """Open the advanced settings dialog"""
         if self.parent_window:
-            dialog = SettingsDialog(self.parent_window.settings, self.parent_window)
+            dialog = SettingsDialog(self.parent_window.settings, self.parent_window, is_dark=self._is_dark)
             if dialog.exec_() == QDialog.Accepted:
                 self.parent_window.settings.update(dialog.get_settings())
-                self.parent_window.save_settings()
+                self.parent_window.resolve_alarm_sounds()
     
     def save_and_close(self):
         """Save settings and close"""
@@ -316,16 +520,18 @@ class SettingsModalDialog(QDialog):
             # Update sound setting
             sound_text = self.sound_path_label.text()
             if sound_text == "Built-in default sound":
-                self.parent_window.settings["default_sound"] = ""
+                default_sound = ""
             else:
-                self.parent_window.settings["default_sound"] = sound_text
+                default_sound = sound_text
                 self.parent_window.alarm_sound = sound_text
             
-            # Update other settings
-            self.parent_window.settings["show_notifications"] = self.notifications_check.isChecked()
-            self.parent_window.settings["auto_start_timers"] = self.auto_start_check.isChecked()
-            
-            self.parent_window.save_settings()
+            # The store only marks itself dirty for keys that actually changed
+            self.parent_window.settings.update({
+                "default_sound": default_sound,
+                "show_notifications": self.notifications_check.isChecked(),
+                "auto_start_timers": self.auto_start_check.isChecked(),
+            })
+            self.parent_window.resolve_alarm_sounds()
         
         self.accept()
     
@@ -335,35 +541,8 @@ class SettingsModalDialog(QDialog):
         event.accept()
 
 
-class HelpModalDialog(QDialog):
-    """Modal help dialog with user guide"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Help & Guide")
-        self.setModal(True)
-        self.resize(600, 500)
-        
-        # Apply theme before setting up UI
-        is_dark = detect_system_theme()
-        apply_theme_to_widget(self, is_dark)
-        
-        self.setup_ui()
-        
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(24, 24, 24, 24)
-        
-        # Header
-        header = QLabel("Help & User Guide")
-        header.setObjectName("titleLabel")
-        layout.addWidget(header)
-        
-        # Scrollable help content
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        
-        help_content = QLabel("""
+# User guide shown by HelpModalDialog, parsed only when the dialog is shown
+HELP_HTML = """
 <h2>Getting Started</h2>
 <p><strong>Creating a New Timer:</strong></p>
 <ol>
@@ -474,18 +653,61 @@ class HelpModalDialog(QDialog):
 <li>Check minimum window size requirements for optimal display</li>
 <li>Clear saved timer state if application fails to start properly</li>
 </ul>
-        """)
-        help_content.setWordWrap(True)
-        help_content.setTextFormat(Qt.RichText)
-        help_content.setObjectName("helpContent")
+"""
+
+
+# HELP_HTML parsed once; each HelpModalDialog shows a clone of it
+_HELP_DOC = None
+
+
+def _help_document(parent):
+    """Return a copy of the parsed help document owned by parent"""
+    global _HELP_DOC
+    if _HELP_DOC is None:
+        _HELP_DOC = QTextDocument()
+        _HELP_DOC.setHtml(HELP_HTML)
+    return _HELP_DOC.clone(parent)
+
+
+class HelpModalDialog(QDialog):
+    """Modal help dialog with user guide"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Help & Guide")
+        self.setModal(True)
+        self.resize(600, 500)
         
-        # Apply proper theme styling to help content
+        # Apply theme before setting up UI
         is_dark = detect_system_theme()
-        apply_theme_to_widget(help_content, is_dark)
+        apply_theme_to_widget(self, is_dark)
         
-        scroll_area.setWidget(help_content)
+        self._loaded = False
+        self.setup_ui()
+        
+    def showEvent(self, event):
+        if not self._loaded:
+            document = _help_document(self.help_content)
+            # Keep the font the stylesheet gave the browser
+            document.setDefaultFont(self.help_content.font())
+            self.help_content.setDocument(document)
+            self._loaded = True
+        super().showEvent(event)
+        
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(24, 24, 24, 24)
+        
+        # Header
+        header = QLabel("Help & User Guide")
+        header.setObjectName("titleLabel")
+        layout.addWidget(header)
         
-        layout.addWidget(scroll_area)
+        # Help text is set on first show; QTextBrowser scrolls by itself
+        self.help_content = QTextBrowser()
+        self.help_content.setOpenExternalLinks(True)
+        self.help_content.setObjectName("helpContent")
+        layout.addWidget(self.help_content)
         
         # Close button
         close_btn = QPushButton("Close")
@@ -516,12 +738,8 @@ class InfoModalDialog(QDialog):
         
         # App logo
         logo_label = QLabel()
-        if self.parent_window:
-            logo_path = os.path.join(self.parent_window.app_dir, "images", "logo.png")
-            if os.path.exists(logo_path):
-                pixmap = QPixmap(logo_path)
-                scaled_pixmap = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_label.setPixmap(scaled_pixmap)
+        if self.parent_window and self.parent_window.logo_path:
+            logo_label.setPixmap(_load_logo(self.parent_window.logo_path, 128))
         logo_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(logo_label)
         
@@ -567,6 +785,10 @@ integration with KDE and GNOME.
         layout.addWidget(close_btn)
 
 
+# Runs of non-whitespace, counted as words in the description limit
+_WORD_RE = re.compile(r"\S+")
+
+
 class TimerDescriptionDialog(QDialog):
     def __init__(self, description="", parent=None):
         super().__init__(parent)
@@ -590,28 +812,41 @@ class TimerDescriptionDialog(QDialog):
         apply_theme_to_widget(self.word_count_label, is_dark)
         layout.addWidget(self.word_count_label)
         
-        # Update word count when text changes
-        self.description_edit.textChanged.connect(self.update_word_count)
-        self.update_word_count()
-        
         # Dialog buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
         apply_theme_to_widget(button_box, is_dark)
         layout.addWidget(button_box)
+        self._ok_button = button_box.button(QDialogButtonBox.Ok)
+        self._word_count = None
+        
+        # Recount words once typing pauses rather than on every keystroke
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.timeout.connect(self.update_word_count)
+        self.description_edit.textChanged.connect(lambda: self._count_timer.start(100))
+        self.update_word_count()
     
     def update_word_count(self):
-        text = self.description_edit.toPlainText().strip()
-        word_count = len(text.split()) if text else 0
+        text = self.description_edit.toPlainText()
+        word_count = sum(1 for _ in _WORD_RE.finditer(text))
+        if word_count == self._word_count:
+            return
+        self._word_count = word_count
         self.word_count_label.setText(f"{word_count}/50 words")
         
         # Disable OK button if over word limit
-        button_box = self.findChild(QDialogButtonBox)
-        if button_box:
-            ok_button = button_box.button(QDialogButtonBox.Ok)
-            if ok_button:
-                ok_button.setEnabled(word_count <= 50)
+        self._ok_button.setEnabled(word_count <= 50)
+    
+    def accept(self):
+        # Settle a pending count so the word limit can't be skipped
+        if self._count_timer.isActive():
+            self._count_timer.stop()
+            self.update_word_count()
+            if not self._ok_button.isEnabled():
+                return
+        super().accept()
     
     def get_description(self):
         return self.description_edit.toPlainText().strip()
@@ -661,28 +896,17 @@ class SoundSelectionDialog(QDialog):
         apply_theme_to_widget(button_box, is_dark)
         layout.addWidget(button_box)
         
-        # Media player for preview
-        self.preview_player = vlc.MediaPlayer()
+        # Shared preview player, acquired on first preview
+        self.preview_player = None
     
     def browse_sound(self):
         file_dialog = QFileDialog(self)
         file_dialog.setNameFilter("Audio Files (*.mp3 *.wav *.ogg)")
         file_dialog.setWindowTitle("Select Notification Sound")
         
-        # Apply theme to file dialog
-        is_dark = detect_system_theme()
-        apply_theme_to_widget(file_dialog, is_dark)
-        
-        # Force theme application to all child widgets after showing
-        file_dialog.show()
-        
-        # Apply theme recursively to all child widgets
-        for child in file_dialog.findChildren(QWidget):
-            apply_theme_to_widget(child, is_dark)
-        
-        # Force style refresh
-        file_dialog.style().unpolish(file_dialog)
-        file_dialog.style().polish(file_dialog)
+        # Theme the file dialog and its children before exec_() shows it,
+        # so each widget is polished once with the property already set
+        apply_theme_to_widget(file_dialog, detect_system_theme(), descendants=True)
         
         if file_dialog.exec_() == QFileDialog.Accepted:
             self.current_sound = file_dialog.selectedFiles()[0]
@@ -697,10 +921,7 @@ class SoundSelectionDialog(QDialog):
                 sound_to_play = parent_app.alarm_sound
         
         if sound_to_play and os.path.exists(sound_to_play):
-            if self.preview_player:
-                self.preview_player.stop()
-                self.preview_player.set_mrl(sound_to_play)
-                self.preview_player.play()
+            self.preview_player = play_preview(sound_to_play)
     
     def use_default_sound(self):
         self.current_sound = ""
@@ -716,7 +937,7 @@ class SoundSelectionDialog(QDialog):
 
 
 class SettingsDialog(QDialog):
-    def __init__(self, settings, parent=None):
+    def __init__(self, settings, parent=None, is_dark=None):
         super().__init__(parent)
         self.setWindowTitle("TimeRing Settings")
         self.setMinimumWidth(500)
@@ -724,8 +945,10 @@ class SettingsDialog(QDialog):
         
         self.settings = settings.copy()  # Make a copy to work with
         
-        # Apply theme before setting up UI
-        is_dark = detect_system_theme()
+        # Apply theme before setting up UI; callers that already know it pass is_dark
+        if is_dark is None:
+            is_dark = detect_system_theme()
+        self._is_dark = is_dark
         apply_theme_to_widget(self, is_dark)
         
         layout = QVBoxLayout(self)
@@ -740,12 +963,6 @@ class SettingsDialog(QDialog):
         self.tabs.addTab(self.notifications_tab, "Notifications")
         self.tabs.addTab(self.sounds_tab, "Sounds")
         
-        # Apply theme to tabs and tab widgets
-        apply_theme_to_widget(self.tabs, is_dark)
-        apply_theme_to_widget(self.general_tab, is_dark)
-        apply_theme_to_widget(self.notifications_tab, is_dark)
-        apply_theme_to_widget(self.sounds_tab, is_dark)
-        
         layout.addWidget(self.tabs)
         
         # Set up each tab
@@ -760,14 +977,14 @@ class SettingsDialog(QDialog):
         apply_theme_to_widget(button_box, is_dark)
         layout.addWidget(button_box)
         
-        # Media player for sound preview
-        self.preview_player = vlc.MediaPlayer()
+        # Shared preview player, acquired on first preview
+        self.preview_player = None
     
     def setup_general_tab(self):
         layout = QVBoxLayout(self.general_tab)
         
         # Get theme info
-        is_dark = detect_system_theme()
+        is_dark = self._is_dark
         
         # General settings group
         general_group = QGroupBox("General Settings")
@@ -814,7 +1031,7 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(self.notifications_tab)
         
         # Get theme info
-        is_dark = detect_system_theme()
+        is_dark = self._is_dark
         
         # Notification settings group
         notifications_group = QGroupBox("Notification Settings")
@@ -837,8 +1054,7 @@ class SettingsDialog(QDialog):
         urgency_layout.setSpacing(12)
         
         urgency_label = QLabel("Notification urgency:")
-        urgency_label.setObjectName("settingsLabel")
-        urgency_label.setStyleSheet("font-size: 14px; font-weight: 500; margin: 0; padding: 0;")
+        urgency_label.setObjectName("urgencyLabel")
         apply_theme_to_widget(urgency_label, is_dark)
         urgency_layout.addWidget(urgency_label)
         
@@ -862,7 +1078,7 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(self.sounds_tab)
         
         # Get theme info
-        is_dark = detect_system_theme()
+        is_dark = self._is_dark
         
         # Default sound selection
         sound_group = QGroupBox("Default Sound")
@@ -921,20 +1137,9 @@ class SettingsDialog(QDialog):
         file_dialog.setNameFilter("Audio Files (*.mp3 *.wav *.ogg)")
         file_dialog.setWindowTitle("Select Default Sound")
         
-        # Apply theme to file dialog
-        is_dark = detect_system_theme()
-        apply_theme_to_widget(file_dialog, is_dark)
-        
-        # Force theme application to all child widgets after showing
-        file_dialog.show()
-        
-        # Apply theme recursively to all child widgets
-        for child in file_dialog.findChildren(QWidget):
-            apply_theme_to_widget(child, is_dark)
-        
-        # Force style refresh
-        file_dialog.style().unpolish(file_dialog)
-        file_dialog.style().polish(file_dialog)
+        # Theme the file dialog and its children before exec_() shows it,
+        # so each widget is polished once with the property already set
+        apply_theme_to_widget(file_dialog, self._is_dark, descendants=True)
         
         if file_dialog.exec_() == QFileDialog.Accepted:
             self.default_sound_path = file_dialog.selectedFiles()[0]
@@ -949,10 +1154,7 @@ class SettingsDialog(QDialog):
                 sound_to_play = parent_app.alarm_sound
         
         if sound_to_play and os.path.exists(sound_to_play):
-            if self.preview_player:
-                self.preview_player.stop()
-                self.preview_player.set_mrl(sound_to_play)
-                self.preview_player.play()
+            self.preview_player = play_preview(sound_to_play)
     
     def use_default_sound(self):
         self.default_sound_path = ""
@@ -975,6 +1177,9 @@ class SettingsDialog(QDialog):
         """Check for updates from GitHub repository"""
 
         try:
+            # requests is only needed here, so keep it off the startup path
+            import requests
+            
             # Check GitHub releases API for latest version
             response = requests.get("https://api.github.com/repos/Lusan-sapkota/TimeRing/releases/latest", timeout=10)
             if response.status_code == 200:
@@ -994,7 +1199,7 @@ class SettingsDialog(QDialog):
                     msg_box.addButton(download_btn, QMessageBox.AcceptRole)
                     
                     # Apply theme
-                    is_dark = detect_system_theme()
+                    is_dark = self._is_dark
                     apply_theme_to_widget(msg_box, is_dark)
                     
                     result = msg_box.exec_()
@@ -1008,7 +1213,7 @@ class SettingsDialog(QDialog):
                     msg_box.setText("You are running the latest version of TimeRing!")
                     msg_box.setStandardButtons(QMessageBox.Ok)
                     
-                    is_dark = detect_system_theme()
+                    is_dark = self._is_dark
                     apply_theme_to_widget(msg_box, is_dark)
                     msg_box.exec_()
             else:
@@ -1022,7 +1227,7 @@ class SettingsDialog(QDialog):
             msg_box.setDetailedText(f"Error: {str(e)}")
             msg_box.setStandardButtons(QMessageBox.Ok)
             
-            is_dark = detect_system_theme()
+            is_dark = self._is_dark
             apply_theme_to_widget(msg_box, is_dark)
             msg_box.exec_()
     
@@ -1032,6 +1237,128 @@ class SettingsDialog(QDialog):
         event.accept()
 
 
+class SettingsWriter(QThread):
+    """Background thread that writes settings.json, coalescing rapid saves"""
+    
+    def __init__(self, path, last_written=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._pending = None
+        self._last_written = last_written
+        self._stopping = False
+    
+    def schedule(self, settings):
+        """Queue a settings snapshot; only the latest pending one gets written"""
+        self._mutex.lock()
+        self._pending = settings
+        self._wake.wakeOne()
+        self._mutex.unlock()
+    
+    def stop(self):
+        """Flush any pending snapshot and wait for the thread to exit"""
+        self._mutex.lock()
+        self._stopping = True
+        self._wake.wakeOne()
+        self._mutex.unlock()
+        self.wait()
+    
+    def run(self):
+        while True:
+            self._mutex.lock()
+            while self._pending is None and not self._stopping:
+                self._wake.wait(self._mutex)
+            settings, self._pending = self._pending, None
+            stopping = self._stopping
+            self._mutex.unlock()
+            
+            # Skip the write when nothing changed since the last one
+            if settings is not None and settings != self._last_written:
+                try:
+                    _atomic_write(self.path, _dumps(settings))
+                    self._last_written = settings
+                except OSError as e:
+                    print(f"Error saving settings: {e}")
+            
+            if stopping:
+                return
+
+
+class SettingsStore:
+    """In-memory settings that hand changed values to a SettingsWriter after a quiet period"""
+    
+    def __init__(self, values, writer, dirty=False, delay_ms=10000):
+        self._values = values
+        self._writer = writer
+        self._dirty = dirty
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(delay_ms)
+        self._flush_timer.timeout.connect(self.flush)
+    
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+    
+    def __getitem__(self, key):
+        return self._values[key]
+    
+    def copy(self):
+        return dict(self._values)
+    
+    def set(self, key, value):
+        """Change one setting; unchanged values don't mark the store dirty"""
+        if key in self._values and self._values[key] == value:
+            return
+        self._values[key] = value
+        self._dirty = True
+        self._flush_timer.start()
+    
+    def update(self, changes):
+        for key, value in changes.items():
+            self.set(key, value)
+    
+    def flush(self):
+        """Hand the current settings to the writer if anything changed"""
+        self._flush_timer.stop()
+        if self._dirty:
+            self._dirty = False
+            self._writer.schedule(dict(self._values))
+
+
+@dataclass
+class TimerState:
+    """One timer's state; saved as a plain dict through to_dict() and from_dict()"""
+    name: str
+    total_seconds: int
+    remaining_seconds: int
+    start_time: float
+    pause_time: Optional[float] = None
+    total_paused_duration: float = 0
+    is_ringing: bool = False
+    sound_path: str = ""
+    description: str = ""
+    is_paused: bool = False
+    has_finished: bool = False
+    last_interaction: float = 0
+    ui_widgets: Optional[dict] = field(default=None, repr=False, compare=False)  # Widgets of its list card, never saved
+    resolved_sound: str = field(default="", repr=False, compare=False)  # Sound file its alarm plays, never saved
+
+    @classmethod
+    def from_dict(cls, data, now):
+        """Build a timer from its saved dict; files from older versions may lack the timing fields"""
+        values = {name: data[name] for name in _TIMER_FIELDS if name in data}
+        values.setdefault("start_time", now)
+        return cls(**values)
+
+    def to_dict(self):
+        """The saved fields as a plain dict"""
+        return {name: getattr(self, name) for name in _TIMER_FIELDS}
+
+
+_TIMER_FIELDS = tuple(f.name for f in fields(TimerState) if f.name not in ("ui_widgets", "resolved_sound"))
+
+
 class TimerApp(QMainWindow):
     def __init__(self, cli_args=None):
         super().__init__()
@@ -1046,58 +1373,132 @@ class TimerApp(QMainWindow):
         self.settings_file = os.path.join(self.config_dir, "settings.json")
         
         # Get the application directory
-        self.app_dir = os.path.dirname(os.path.abspath(__file__))
+        self.app_dir = _APP_DIR
         self.alarm_sound = os.path.join(self.app_dir, "sounds", "timesup.mp3")
         
+        # Asset paths never change after startup, so resolve them once;
+        # logo_path is empty when the bundled logo is missing
+        self.icons_dir = os.path.join(self.app_dir, "images", "icons")
+        logo_path = os.path.join(self.app_dir, "images", "logo.png")
+        self.logo_path = logo_path if os.path.exists(logo_path) else ""
+        
         # Set application icon
-        icon_path = os.path.join(self.app_dir, "images", "logo.png")
-        self.setWindowIcon(QIcon(icon_path))
+        self.setWindowIcon(QIcon(logo_path))
         
         # Create config directory if it doesn't exist
         os.makedirs(self.config_dir, exist_ok=True)
         
         # Load settings
-        self.settings = self.load_settings()
+        settings = self.load_settings()
+        
+        # Settings are written off the GUI thread
+        self.settings_writer = SettingsWriter(self.settings_file, self._settings_on_disk)
+        self.settings_writer.start()
+        QApplication.instance().aboutToQuit.connect(self.settings_writer.stop)
+        
+        # Changes are kept in memory and flushed after 10s of quiet or on close;
+        # defaults merged into (or replacing) the file still get written once
+        self.settings = SettingsStore(settings, self.settings_writer, dirty=settings != self._settings_on_disk)
         
         # Handle CLI arguments
         self.handle_cli_args()
         
-        # Active timers and media players
-        self.timers = []
+        # Active timers keyed by a stable id, newest first
+        self.timers = {}
+        self._next_timer_id = 0
         self.last_timer_count = 0  # Track timer count to prevent unnecessary rebuilds
-        self.current_primary_timer_index = 0  # Track which timer is currently displayed
-        self.media_players = {}
-        self.timer_threads = {}
-        self.timer_events = {}
+        self.current_primary_timer_id = None  # Track which timer is currently displayed
+        # Only one alarm sound plays at a time; the owner is the ringing timer it belongs to
+        self._alarm_thread = None
+        self._alarm_owner = None
+        self._row_pool = []  # Detached timer cards kept for reuse across list rebuilds
+        self._is_dark = detect_system_theme()
+        self._icon_cache = {}  # Icons by name for the current theme
+        self._large_time_text = None  # Last text/status shown in the large timer display
+        self._large_status = None
+        QApplication.instance().paletteChanged.connect(self.on_palette_changed)
         
         # Initialize UI
         self.init_ui()
         
-        # Load saved timers
-        self.load_timers()
+        # Display clocks, run by sync_clocks() only while the window is on screen
+        # and a timer is counting down: one countdown for every timer, the
+        # card labels every 100ms and the list/large display every 500ms
+        self.countdown_timer = QTimer(self)
+        self.countdown_timer.setInterval(100)
+        self.countdown_timer.timeout.connect(self.tick)
         
-        # Track last save time to avoid excessive I/O
-        self.last_save_time = 0
-        self.save_threshold = 1.0  # Save at most once per second
-        
-        # Update timer display more frequently for smoother updates
         self.update_timer_labels_timer = QTimer(self)
+        self.update_timer_labels_timer.setInterval(100)
         self.update_timer_labels_timer.timeout.connect(self.update_timer_labels)
-        self.update_timer_labels_timer.start(100)  # Update only labels every 100ms
-
+        
         self.update_timer = QTimer(self)
+        self.update_timer.setInterval(500)
         self.update_timer.timeout.connect(self.update_timers_display)
-        self.update_timer.start(500)  # Rebuild UI every 500ms (or you can trigger manually)
+        
+        # Completion is event-driven: a single-shot timer armed for the earliest
+        # deadline in a min-heap of (deadline, seq, timer id) entries
+        self._expiry_heap = []
+        self._expiry_seq = 0
+        self.expiry_timer = QTimer(self)
+        self.expiry_timer.setSingleShot(True)
+        self.expiry_timer.setTimerType(Qt.PreciseTimer)
+        self.expiry_timer.timeout.connect(self.on_timer_expired)
+        
+        # Load saved timers
+        self.load_timers()
+        
+        # Batch timer saves: changes mark the state dirty and are flushed together
+        self._timers_dirty = False
+        self.save_timers_timer = QTimer(self)
+        self.save_timers_timer.timeout.connect(self.flush_timers)
+        self.save_timers_timer.start(10000)  # Write pending changes every 10s
 
+    def on_palette_changed(self):
+        """Re-theme the window only when a palette change flips light/dark"""
+        is_dark = detect_system_theme()
+        if is_dark == self._is_dark:
+            return
+        self._is_dark = is_dark
+        self._icon_cache = {}
+        apply_theme_to_widget(self, is_dark)
+        apply_theme_to_widget(self.centralWidget().widget(), is_dark)
+        
+        # Cards carry icons in the old color, so drop them along with the pool;
+        # row holders are deleted later, so detach them before the restyle below
+        holders = [self.timers_list.itemWidget(self.timers_list.item(row))
+                   for row in range(self.timers_list.count())]
+        self.timers_list.clear()
+        for holder in holders:
+            if holder is not None:
+                holder.setParent(None)
+                holder.deleteLater()
+        for card_widget in self._row_pool:
+            card_widget.deleteLater()
+        self._row_pool = []
+        
+        # Descendant rules key off the root property, so restyle the rest of the tree once
+        for widget in self.findChildren(QWidget):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+        
+        self.rebuild_timers_list()
+        self._large_status = None
+        self.update_large_timer_display()
+    
     def get_icon(self, name):
         """Get icon by name from bundled icons with theme support"""
-        icon_path = os.path.join(self.app_dir, "images", "icons", f"{name}.svg")
+        icon = self._icon_cache.get(name)
+        if icon is not None:
+            return icon
+        
+        icon_path = os.path.join(self.icons_dir, f"{name}.svg")
         
         # Determine icon color based on theme
-        is_dark = detect_system_theme()
-        icon_color = "#ffffff" if is_dark else "#374151"  # White for dark theme, dark gray for light
+        icon_color = "#ffffff" if self._is_dark else "#374151"  # White for dark theme, dark gray for light
         
-        return load_svg_icon(icon_path, icon_color, 24)
+        icon = self._icon_cache[name] = load_svg_icon(icon_path, icon_color, 24)
+        return icon
     
     def format_time(self, total_seconds):
         """Formats seconds into HH:MM:SS or MM:SS"""
@@ -1115,9 +1516,9 @@ class TimerApp(QMainWindow):
         if self.cli_args and self.cli_args.set_sound:
             sound_path = self.cli_args.set_sound
             if os.path.exists(sound_path):
-                self.settings["default_sound"] = sound_path
+                self.settings.set("default_sound", sound_path)
                 self.alarm_sound = sound_path
-                self.save_settings()
+                self.save_settings()  # Persist CLI changes right away
                 print(f"Default sound set to: {sound_path}")
             else:
                 print(f"Error: Sound file not found: {sound_path}")
@@ -1137,9 +1538,10 @@ class TimerApp(QMainWindow):
         main_layout.setContentsMargins(12, 12, 12, 12)  # Reduced margins for compact mode
         main_layout.setSpacing(12)  # Reduced spacing for compact mode
         
-        # Apply theme
-        is_dark = detect_system_theme()
-        apply_theme_to_widget(main_widget, is_dark)
+        # Apply theme; set on the window too while nothing is polished yet, so the
+        # first show already paints in the right theme
+        apply_theme_to_widget(self, self._is_dark)
+        apply_theme_to_widget(main_widget, self._is_dark)
         
         # Header with menu buttons and title
         header_widget = QWidget()
@@ -1149,11 +1551,8 @@ class TimerApp(QMainWindow):
 
         # App Logo
         logo_label = QLabel()
-        logo_path = os.path.join(self.app_dir, "images", "logo.png")
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            scaled_pixmap = pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
+        if self.logo_path:
+            logo_label.setPixmap(_load_logo(self.logo_path, 40))
         header_layout.addWidget(logo_label)
         
         # App Title
@@ -1242,7 +1641,7 @@ class TimerApp(QMainWindow):
         active_timer_layout.addWidget(self.large_timer_time)
 
         self.large_timer_status = QLabel("Running")
-        self.large_timer_status.setObjectName("statusLabel")
+        self.large_timer_status.setObjectName("largeTimerStatus")
         self.large_timer_status.setAlignment(Qt.AlignCenter)
         self.large_timer_status.setAlignment(Qt.AlignCenter)
         
@@ -1265,13 +1664,13 @@ class TimerApp(QMainWindow):
         self.large_pause_button = QPushButton("Pause")
         self.large_pause_button.setIcon(self.get_icon("pause"))
         self.large_pause_button.setObjectName("warningButton")
-        self.large_pause_button.clicked.connect(lambda: self.toggle_timer(self.current_primary_timer_index))
+        self.large_pause_button.clicked.connect(lambda: self.toggle_timer(self.current_primary_timer_id))
         large_timer_controls.addWidget(self.large_pause_button)
         
         self.large_stop_button = QPushButton("Stop")
         self.large_stop_button.setIcon(self.get_icon("stop"))
         self.large_stop_button.setObjectName("dangerButton")
-        self.large_stop_button.clicked.connect(lambda: self.stop_timer(self.current_primary_timer_index))
+        self.large_stop_button.clicked.connect(lambda: self.stop_timer(self.current_primary_timer_id))
         large_timer_controls.addWidget(self.large_stop_button)
         
         # Next timer button
@@ -1358,21 +1757,14 @@ class TimerApp(QMainWindow):
             btn.style().unpolish(btn)
             btn.style().polish(btn)
 
-    def create_timer_card(self, timer, timer_index):
+    def create_timer_card(self, timer, timer_id):
         """Creates a widget for a single timer card."""
         card_widget = QWidget()
         card_layout = QGridLayout(card_widget)
         card_widget.setObjectName("timerCard")
 
-        # Set proper size policy for consistent sizing
-        card_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-
-        # Adjust minimum height based on compact mode
-        is_compact = self.property("compactMode")
-        if is_compact:
-            card_widget.setMinimumHeight(100)
-        else:
-            card_widget.setMinimumHeight(120)
+        # Fill the row holder it sits in
+        card_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         # --- Always show timer name and icon ---
         name_layout = QHBoxLayout()
@@ -1380,36 +1772,23 @@ class TimerApp(QMainWindow):
 
         icon_label = QLabel()
         icon_label.setFixedSize(24, 24)
-        if timer["is_ringing"]:
-            icon_label.setPixmap(self.get_icon("bell").pixmap(24, 24))
-        elif timer.get("has_finished", False):
-            icon_label.setPixmap(self.get_icon("alarm").pixmap(24, 24))
-        elif timer.get("is_paused", False):
-            icon_label.setPixmap(self.get_icon("pause").pixmap(24, 24))
-        else:
-            icon_label.setPixmap(self.get_icon("play").pixmap(24, 24))
-
         icon_label.setObjectName("timerIcon")
-        name_label = QLabel(timer["name"])
+        name_label = QLabel()
         name_label.setObjectName("timerName")
-        name_label.style().unpolish(name_label)
-        name_label.style().polish(name_label)
         name_layout.addWidget(icon_label)
         name_layout.addWidget(name_label)
         name_layout.addStretch()
 
         card_layout.addLayout(name_layout, 0, 0, 1, 4)
 
-        # Timer description
-        if timer.get("description"):
-            description_label = QLabel(timer["description"])
-            description_label.setObjectName("timerDescription")
-            description_label.setWordWrap(True)
-            card_layout.addWidget(description_label, 1, 0, 1, 4)
+        # Timer description (hidden when the bound timer has none)
+        description_label = QLabel()
+        description_label.setObjectName("timerDescription")
+        description_label.setWordWrap(True)
+        card_layout.addWidget(description_label, 1, 0, 1, 4)
 
         # Time display
-        elapsed_formatted = self.format_time(timer["total_seconds"])
-        time_label = QLabel(f"{self.format_time(timer['remaining_seconds'])} | {elapsed_formatted}")
+        time_label = QLabel()
         time_label.setObjectName("timerTime")
         time_label.setMaximumWidth(400)  # Limit width to keep it compact
         time_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
@@ -1423,31 +1802,13 @@ class TimerApp(QMainWindow):
         status_label = QLabel()
         status_label.setObjectName("timerStatus")
         status_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        status_label.setStyleSheet("font-size: 18px; font-weight: bold;")
-
-        if timer["is_ringing"]:
-            status_icon_label.setPixmap(self.get_icon("bell").pixmap(24, 24))
-            status_label.setText("Ringing!")
-            status_label.setStyleSheet("color: #ef4444; font-weight: bold; ")
-        elif timer.get("has_finished", False):
-            status_icon_label.setPixmap(self.get_icon("alarm").pixmap(24, 24))
-            status_label.setText("Time's Up!")
-            status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-        elif timer.get("is_paused", False):
-            status_icon_label.setPixmap(self.get_icon("pause").pixmap(24, 24))
-            status_label.setText("Paused")
-            status_label.setStyleSheet("color: #f59e0b; font-weight: 500;")
-        else:
-            status_icon_label.setPixmap(self.get_icon("play").pixmap(24, 24))
-            status_label.setText("Running")
-            status_label.setStyleSheet("color: #10b981; font-weight: 500;")
 
         status_row.addWidget(status_icon_label)
         status_row.addWidget(status_label)
         status_row.addStretch()
         card_layout.addLayout(status_row, 2, 2, 1, 2)
 
-        # Buttons
+        # Buttons act on whichever timer the card is currently bound to
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(8)
         buttons_layout.setContentsMargins(0, 12, 0, 0)
@@ -1455,87 +1816,95 @@ class TimerApp(QMainWindow):
         edit_btn = QPushButton()
         edit_btn.setIcon(self.get_icon("edit"))
         edit_btn.setToolTip("Edit Description")
-        edit_btn.style().unpolish(edit_btn)
-        edit_btn.style().polish(edit_btn)
-        edit_btn.clicked.connect(lambda: self.edit_timer_description(timer_index))
+        edit_btn.clicked.connect(functools.partial(self.run_card_action, card_widget, self.edit_timer_description))
         buttons_layout.addWidget(edit_btn)
 
         sound_btn = QPushButton()
         sound_btn.setIcon(self.get_icon("sound"))
         sound_btn.setToolTip("Change Sound")
-        sound_btn.style().unpolish(sound_btn)
-        sound_btn.style().polish(sound_btn)
-        sound_btn.clicked.connect(lambda: self.edit_timer_sound(timer_index))
+        sound_btn.clicked.connect(functools.partial(self.run_card_action, card_widget, self.edit_timer_sound))
         buttons_layout.addWidget(sound_btn)
 
         rerun_btn = QPushButton()
         rerun_btn.setIcon(self.get_icon("rerun"))
         rerun_btn.setToolTip("Rerun Timer")
-        rerun_btn.style().unpolish(rerun_btn)
-        rerun_btn.style().polish(rerun_btn)
-        rerun_btn.clicked.connect(lambda: self.rerun_timer(timer_index))
+        rerun_btn.clicked.connect(functools.partial(self.run_card_action, card_widget, self.rerun_timer))
         buttons_layout.addWidget(rerun_btn)
 
         pause_btn = QPushButton()
-        pause_btn.setIcon(self.get_icon("play")) # Icon changes based on state
         pause_btn.setToolTip("Pause/Resume")
-        pause_btn.style().unpolish(pause_btn)
-        pause_btn.style().polish(pause_btn)
-        pause_btn.clicked.connect(lambda: self.toggle_timer(timer_index))
+        pause_btn.clicked.connect(functools.partial(self.run_card_action, card_widget, self.toggle_timer))
         buttons_layout.addWidget(pause_btn)
 
         stop_btn = QPushButton()
         stop_btn.setIcon(self.get_icon("stop"))
         stop_btn.setToolTip("Stop Timer")
-        stop_btn.style().unpolish(stop_btn)
-        stop_btn.style().polish(stop_btn)
-        stop_btn.clicked.connect(lambda: self.stop_timer(timer_index))
+        stop_btn.clicked.connect(functools.partial(self.run_card_action, card_widget, self.stop_timer))
         buttons_layout.addWidget(stop_btn)
 
         delete_btn = QPushButton()
         delete_btn.setIcon(self.get_icon("delete"))
         delete_btn.setToolTip("Delete Timer")
-        delete_btn.style().unpolish(delete_btn)
-        delete_btn.style().polish(delete_btn)
-        delete_btn.clicked.connect(lambda: self.delete_timer(timer_index))
+        delete_btn.clicked.connect(functools.partial(self.run_card_action, card_widget, self.delete_timer))
         buttons_layout.addWidget(delete_btn)
 
         card_layout.addLayout(buttons_layout, 3, 0, 1, 4)
 
-        # Now update status and pause_btn state
-        if timer["is_ringing"]:
-            card_widget.setProperty("status", "ringing")
-            status_label.setText("Ringing!")
-            status_label.setStyleSheet("color: #ef4444; font-weight: bold; ")
-            pause_btn.setEnabled(False)
-            pause_btn.setStyleSheet("opacity: 0.5; background-color: #6b7280;")
-        elif timer.get("has_finished", False):
-            card_widget.setProperty("status", "ringing")  # treat finished as ringing for style
-            status_label.setText("Time's Up!")
-            status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-            pause_btn.setIcon(self.get_icon("play"))
-            pause_btn.setEnabled(False)
-            pause_btn.setStyleSheet("opacity: 0.5; background-color: #6b7280;")
-        elif timer.get("is_paused", False):
-            card_widget.setProperty("status", "paused")
-            status_label.setText("Paused")
-            status_label.setStyleSheet("")
-            pause_btn.setIcon(self.get_icon("play"))
-            pause_btn.setEnabled(True)
-            pause_btn.setStyleSheet("")
+        card_widget.icon_label = icon_label
+        card_widget.name_label = name_label
+        card_widget.description_label = description_label
+        card_widget.time_label = time_label
+        card_widget.status_icon_label = status_icon_label
+        card_widget.status_label = status_label
+        card_widget.pause_btn = pause_btn
+
+        self.bind_timer_card(card_widget, timer, timer_id)
+        return card_widget, time_label, status_label, pause_btn
+    
+    def run_card_action(self, card_widget, action):
+        """Run a card button's action on the timer the card is currently bound to"""
+        action(card_widget.timer_id)
+    
+    def bind_timer_card(self, card_widget, timer, timer_id):
+        """Fill a new or pooled timer card with the given timer's state."""
+        card_widget.timer_id = timer_id
+
+        # Adjust minimum height based on compact mode
+        card_widget.setMinimumHeight(100 if self.property("compactMode") else 120)
+
+        card_widget.name_label.setText(timer.name)
+        description = timer.description
+        card_widget.description_label.setText(description or "")
+        card_widget.description_label.setVisible(bool(description))
+
+        card_widget.time_label.setText(
+            f"{self.format_time(timer.remaining_seconds)} | {self.format_time(timer.total_seconds)}"
+        )
+
+        status_label = card_widget.status_label
+        pause_btn = card_widget.pause_btn
+        if timer.is_ringing:
+            icon_name, status, text = "bell", "ringing", "Ringing!"
+        elif timer.has_finished:
+            icon_name, status, text = "alarm", "ringing", "Time's Up!"  # treat finished as ringing for style
+        elif timer.is_paused:
+            icon_name, status, text = "pause", "paused", "Paused"
         else:
-            card_widget.setProperty("status", "running")
-            status_label.setText("Running")
-            status_label.setStyleSheet("")
-            pause_btn.setIcon(self.get_icon("pause"))
-            pause_btn.setEnabled(True)
-            pause_btn.setStyleSheet("")
+            icon_name, status, text = "play", "running", "Running"
+
+        pixmap = self.get_icon(icon_name).pixmap(24, 24)
+        card_widget.icon_label.setPixmap(pixmap)
+        card_widget.status_icon_label.setPixmap(pixmap)
+        status_label.setText(text)
+
+        set_status_property(status_label, status)
+        pause_btn.setIcon(self.get_icon("play" if status in ("ringing", "paused") else "pause"))
+        pause_btn.setEnabled(status != "ringing")
 
         # Force style refresh to apply new properties
+        card_widget.setProperty("status", status)
         card_widget.style().unpolish(card_widget)
         card_widget.style().polish(card_widget)
-
-        return card_widget, time_label, status_label, pause_btn
     
     def set_preset_time(self, hours, minutes, seconds):
         """Set preset time values"""
@@ -1579,71 +1948,58 @@ class TimerApp(QMainWindow):
     def open_settings(self):
         dialog = SettingsDialog(self.settings, self)
         if dialog.exec_() == QDialog.Accepted:
-            self.settings = dialog.get_settings()
-            self.save_settings()
+            self.settings.update(dialog.get_settings())
             
             # Update default sound if changed
             if self.settings.get("default_sound"):
                 self.alarm_sound = self.settings["default_sound"]
+            self.resolve_alarm_sounds()
     
-    def edit_timer_description(self, timer_index):
-        if timer_index < len(self.timers):
-            timer = self.timers[timer_index]
-            dialog = TimerEditDialog(timer.get("name", ""), timer.get("description", ""), self)
+    def edit_timer_description(self, timer_id):
+        if timer_id in self.timers:
+            timer = self.timers[timer_id]
+            dialog = TimerEditDialog(timer.name, timer.description, self)
             if dialog.exec_() == QDialog.Accepted:
                 new_name, new_desc = dialog.get_data()
-                timer["name"] = new_name
-                timer["description"] = new_desc
+                timer.name = new_name
+                timer.description = new_desc
                 self.save_timers(force=True)
                 self.rebuild_timers_list()
                 self.update_large_timer_display()
     
-    def edit_timer_sound(self, timer_index):
-        if timer_index < len(self.timers):
-            timer = self.timers[timer_index]
-            current_sound = timer.get("sound_path", "")
+    def edit_timer_sound(self, timer_id):
+        if timer_id in self.timers:
+            timer = self.timers[timer_id]
+            current_sound = timer.sound_path
             dialog = SoundSelectionDialog(current_sound, self)
             if dialog.exec_() == QDialog.Accepted:
-                timer["sound_path"] = dialog.get_sound_path()
+                timer.sound_path = dialog.get_sound_path()
+                timer.resolved_sound = self.resolve_alarm_sound(timer)
                 self.save_timers()
                 
                 # If timer is ringing, update the sound
-                if timer["is_ringing"] and timer_index in self.media_players:
-                    self.media_players[timer_index].stop()
-                    self.play_alarm(timer_index)
+                if timer.is_ringing and self._alarm_owner == timer_id:
+                    self.play_alarm(timer_id)
     
     def add_timer(self, timer_data):
-        import time
         current_time = time.time()
-        timer = {
-            "name": timer_data["name"],
-            "total_seconds": timer_data["total_seconds"],
-            "remaining_seconds": timer_data["total_seconds"],
-            "start_time": current_time,
-            "pause_time": None,
-            "total_paused_duration": 0,
-            "is_ringing": False,
-            "sound_path": timer_data["sound_path"],
-            "description": timer_data["description"],
-            "is_paused": False,
-            "has_finished": False,
-            "last_interaction": current_time  # <--- Track last interaction
-        }
-        self.timers.insert(0, timer)
-        self.current_primary_timer_index = 0  # <--- New timer is always the active timer
-        self.save_timers()
-        
-        # Create a threading event for this timer
-        timer_index = 0
-        self.timer_events[timer_index] = threading.Event()
-
-        timer_thread = threading.Thread(
-            target=self.run_timer,
-            args=(timer_index,),
-            daemon=True
+        timer = TimerState(
+            name=timer_data["name"],
+            total_seconds=timer_data["total_seconds"],
+            remaining_seconds=timer_data["total_seconds"],
+            start_time=current_time,
+            sound_path=timer_data["sound_path"],
+            description=timer_data["description"],
+            last_interaction=current_time  # <--- Track last interaction
         )
-        self.timer_threads[timer_index] = timer_thread
-        timer_thread.start()
+        timer.resolved_sound = self.resolve_alarm_sound(timer)
+        timer_id = self._next_timer_id
+        self._next_timer_id += 1
+        self.timers = {timer_id: timer, **self.timers}  # Newest timers come first
+        self.current_primary_timer_id = timer_id  # <--- New timer is always the active timer
+        self.schedule_expiry(timer_id)
+        self.save_timers()
+        self.refresh_display()
 
     def open_timer_creation_dialog(self):
         """Open the timer creation dialog"""
@@ -1652,121 +2008,147 @@ class TimerApp(QMainWindow):
             timer_data = dialog.get_timer_data()
             self.add_timer(timer_data)
 
-    def run_timer(self, timer_index):
-        timer = self.timers[timer_index]
-        event = self.timer_events[timer_index]
-        
-        while timer["remaining_seconds"] > 0:
-            # Check if we should pause
-            if timer.get("is_paused", False):
-                event.wait()  # Wait until resumed
-                event.clear()
-                
-                # Check if the timer was removed while paused
-                if timer_index not in self.timer_events:
-                    return
-            
-            # Use smaller sleep intervals for more precise timing
-            time.sleep(0.1)  # Check every 100ms instead of 1 second
-            
-            # Calculate actual elapsed time based on real time
-            current_time = time.time()
-            if not timer.get("is_paused", False):
-                elapsed_since_start = current_time - timer["start_time"]
-                actual_remaining = timer["total_seconds"] - (elapsed_since_start - timer["total_paused_duration"])
-                timer["remaining_seconds"] = max(0, int(actual_remaining))
+    def tick(self):
+        """Advance every running timer's display countdown from the wall clock"""
+        current_time = time.time()
+        for timer in self.timers.values():
+            if not self.is_timer_running(timer):
+                continue
             
-            # Save every few iterations to reduce I/O
-            if int(current_time * 10) % 10 == 0:  # Save once per second
-                self.save_timers()
-        
-        # Timer finished
-        timer["is_ringing"] = True
-        timer["has_finished"] = True
+            elapsed_since_start = current_time - timer.start_time
+            actual_remaining = timer.total_seconds - (elapsed_since_start - timer.total_paused_duration)
+            # Only the expiry timer finishes timers; hold the last second until it fires
+            timer.remaining_seconds = max(1, int(actual_remaining))
+    
+    def sync_clocks(self):
+        """Run the display clocks only while the window is on screen and a timer is running"""
+        # Completion doesn't depend on them: the expiry timer keeps running while hidden
+        clocks = (self.countdown_timer, self.update_timer_labels_timer, self.update_timer)
+        if self.is_display_hidden() or not any(map(self.is_timer_running, self.timers.values())):
+            for clock in clocks:
+                clock.stop()
+        else:
+            for clock in clocks:
+                if not clock.isActive():
+                    clock.start()
+    
+    def is_timer_running(self, timer):
+        """Whether a timer is counting down (not paused, ringing or finished)"""
+        return not timer.is_paused and not timer.is_ringing and not timer.has_finished
+    
+    def timer_deadline(self, timer):
+        """Wall-clock time at which a running timer's remaining_seconds reaches 0"""
+        # remaining_seconds is truncated to whole seconds, so it hits 0 a second early
+        return timer.start_time + timer.total_paused_duration + timer.total_seconds - 1
+    
+    def schedule_expiry(self, timer_id):
+        """Queue a (re)started timer's deadline and make sure the clocks are running"""
+        self._expiry_seq += 1
+        heapq.heappush(self._expiry_heap, (self.timer_deadline(self.timers[timer_id]), self._expiry_seq, timer_id))
+        self.arm_expiry_timer()
+        self.sync_clocks()
+    
+    def is_live_expiry(self, entry):
+        """Whether a heap entry still matches a running timer's current deadline"""
+        deadline, _, timer_id = entry
+        timer = self.timers.get(timer_id)
+        # Paused, stopped, deleted and rescheduled timers leave stale entries behind
+        return (timer is not None and self.is_timer_running(timer)
+                and self.timer_deadline(timer) == deadline)
+    
+    def arm_expiry_timer(self):
+        """Point the single-shot expiry timer at the earliest live deadline"""
+        heap = self._expiry_heap
+        while heap and not self.is_live_expiry(heap[0]):
+            heapq.heappop(heap)
+        if heap:
+            self.expiry_timer.start(max(0, int((heap[0][0] - time.time()) * 1000)))
+        else:
+            self.expiry_timer.stop()
+    
+    def on_timer_expired(self):
+        """Finish every timer whose deadline has passed, then re-arm for the next one"""
+        current_time = time.time()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= current_time:
+            entry = heapq.heappop(heap)
+            if self.is_live_expiry(entry):
+                timer_id = entry[2]
+                self.timers[timer_id].remaining_seconds = 0
+                self.finish_timer(timer_id)
+        self.arm_expiry_timer()
+        
+        # The clocks may be stopped, so show the ringing timers now
+        self.sync_clocks()
+        self.refresh_display()
+    
+    def finish_timer(self, timer_id):
+        """Mark a timer as finished, notify and start its alarm"""
+        timer = self.timers[timer_id]
+        timer.is_ringing = True
+        timer.has_finished = True
         self.save_timers(force=True)
         
         # Send notification if enabled
         if self.settings.get("show_notifications", True):
-            notification_text = f"Timer '{timer['name']}' completed!"
+            notification_text = f"Timer '{timer.name}' completed!"
             
             # Add description to notification if enabled
-            if self.settings.get("include_description", True) and timer.get("description"):
-                notification_text += f"\n{timer['description'][:50]}..."
+            if self.settings.get("include_description", True) and timer.description:
+                notification_text += f"\n{timer.description[:50]}..."
             
             # Set urgency level
             urgency = self.settings.get("notification_urgency", "Normal").lower()
             
-            # Send notification with appropriate urgency
-            subprocess.run([
-                "notify-send",
-                "--urgency=" + urgency,
-                "TimeRing",
-                notification_text
-            ])
-        
-        # Mark as finished
-        timer["has_finished"] = True
+            send_notification("TimeRing", notification_text, urgency)
         
         # Play alarm sound in loop
-        self.play_alarm(timer_index)
+        self.play_alarm(timer_id)
     
-    def pause_resume_timer(self, timer_index):
-        if timer_index < len(self.timers):
-            timer = self.timers[timer_index]
+    def pause_resume_timer(self, timer_id):
+        if timer_id in self.timers:
+            timer = self.timers[timer_id]
             
             # Don't pause if already completed
-            if timer["is_ringing"] or timer.get("has_finished", False):
+            if timer.is_ringing or timer.has_finished:
                 return
             
             current_time = time.time()
             
-            if timer.get("is_paused", False):
+            if timer.is_paused:
                 # Resuming: calculate total paused duration and update start time
-                if timer.get("pause_time"):
-                    pause_duration = current_time - timer["pause_time"]
-                    timer["total_paused_duration"] += pause_duration
-                    timer["pause_time"] = None
-                timer["is_paused"] = False
-
-                # --- Always signal the event to resume the thread ---
-                if timer_index in self.timer_events:
-                    self.timer_events[timer_index].set()
-
-                # --- Start a new thread only if needed ---
-                if timer_index not in self.timer_threads or not self.timer_threads[timer_index].is_alive():
-                    timer_thread = threading.Thread(
-                        target=self.run_timer,
-                        args=(timer_index,),
-                        daemon=True
-                    )
-                    self.timer_threads[timer_index] = timer_thread
-                    timer_thread.start()
+                if timer.pause_time:
+                    pause_duration = current_time - timer.pause_time
+                    timer.total_paused_duration += pause_duration
+                    timer.pause_time = None
+                timer.is_paused = False
+                self.schedule_expiry(timer_id)
             else:
                 # Pausing: record the pause time
-                timer["pause_time"] = current_time
-                timer["is_paused"] = True
+                timer.pause_time = current_time
+                timer.is_paused = True
 
-            timer["last_interaction"] = time.time()
-            self.current_primary_timer_index = timer_index
+            timer.last_interaction = time.time()
+            self.current_primary_timer_id = timer_id
             self.save_timers(force=True)
-            self.update_timers_display()
+            self.sync_clocks()
+            self.refresh_display()
 
     
-    def rerun_timer(self, timer_index):
+    def rerun_timer(self, timer_id):
         """Reruns a timer from its original duration."""
-        if timer_index < len(self.timers) and self.timers[timer_index]:
-            timer = self.timers[timer_index]
+        if timer_id in self.timers:
+            timer = self.timers[timer_id]
             
             # Create styled message box
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle('Rerun Timer')
-            msg_box.setText(f"Are you sure you want to rerun the timer '{timer['name']}'?")
+            msg_box.setText(f"Are you sure you want to rerun the timer '{timer.name}'?")
             msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
             msg_box.setDefaultButton(QMessageBox.No)
             
             # Apply theme to message box
-            is_dark = detect_system_theme()
-            apply_theme_to_widget(msg_box, is_dark)
+            apply_theme_to_widget(msg_box, self._is_dark)
             
             reply = msg_box.exec_()
 
@@ -1775,59 +2157,42 @@ class TimerApp(QMainWindow):
             
             # Reset timer properties with precise timing
             current_time = time.time()
-            timer["remaining_seconds"] = timer["total_seconds"]
-            timer["start_time"] = current_time
-            timer["pause_time"] = None
-            timer["total_paused_duration"] = 0
-            timer["is_paused"] = False
-            timer["is_ringing"] = False
-            timer["has_finished"] = False
+            timer.remaining_seconds = timer.total_seconds
+            timer.start_time = current_time
+            timer.pause_time = None
+            timer.total_paused_duration = 0
+            timer.is_paused = False
+            timer.is_ringing = False
+            timer.has_finished = False
+            self.schedule_expiry(timer_id)
             
-            timer["last_interaction"] = current_time
-            self.current_primary_timer_index = timer_index  # <--- Make this the active timer
+            timer.last_interaction = current_time
+            self.current_primary_timer_id = timer_id  # <--- Make this the active timer
             self.save_timers(force=True)
 
-            # Stop any previous alarm thread for this timer
-            if timer_index in self.timer_threads and hasattr(self.timer_threads[timer_index], 'stop_event'):
-                self.timer_threads[timer_index].stop_event.set()
-
-            # Create a new threading event
-            self.timer_events[timer_index] = threading.Event()
-            
-            # Start a new timer thread
-            timer_thread = threading.Thread(
-                target=self.run_timer,
-                args=(timer_index,),
-                daemon=True
-            )
-            self.timer_threads[timer_index] = timer_thread
-            timer_thread.start()
+            # Stop any previous alarm for this timer
+            self.stop_alarm(timer_id)
             
-            self.update_timers_display()
+            self.refresh_display()
 
-    def toggle_timer(self, timer_index):
+    def toggle_timer(self, timer_id):
         """Toggle timer pause/resume state"""
-        if timer_index >= 0:
-            self.pause_resume_timer(timer_index)
+        if timer_id in self.timers:
+            self.pause_resume_timer(timer_id)
     
-    def play_alarm(self, timer_index):
-        if timer_index >= len(self.timers) or self.timers[timer_index] is None:
+    def play_alarm(self, timer_id):
+        if timer_id not in self.timers:
             return
 
-        timer = self.timers[timer_index]
-        sound_path = timer.get("sound_path", "")
-        # Use per-timer sound if set and exists
-        if sound_path and os.path.exists(sound_path):
-            pass  # Use this sound
-        elif self.settings.get("default_sound") and os.path.exists(self.settings["default_sound"]):
-            sound_path = self.settings["default_sound"]
-        else:
-            sound_path = self.alarm_sound
+        timer = self.timers[timer_id]
+        # The sound was resolved when it was chosen; the file may have been
+        # deleted or unmounted since, so re-check it and resolve again if so
+        sound_path = timer.resolved_sound
+        if not os.path.exists(sound_path):
+            sound_path = timer.resolved_sound = self.resolve_alarm_sound(timer)
 
-        # Stop any existing alarm thread for this timer
-        if timer_index in self.timer_threads and self.timer_threads[timer_index].is_alive():
-             if hasattr(self.timer_threads[timer_index], 'stop_event'):
-                self.timer_threads[timer_index].stop_event.set()
+        # A new alarm takes over the single alarm player from whichever timer had it
+        self.stop_alarm()
 
         # Use a thread to play sound in a loop via subprocess
         stop_event = threading.Event()
@@ -1835,7 +2200,10 @@ class TimerApp(QMainWindow):
             while not event.is_set():
                 try:
                     # Use a short timeout to allow the loop to check the event
-                    subprocess.run(["play", "-q", path], timeout=2)
+                    if subprocess.run(["play", "-q", path], timeout=2).returncode != 0:
+                        # An unreadable file fails at once; don't respawn play in a tight loop
+                        print(f"Error playing sound: {path}")
+                        break
                 except subprocess.TimeoutExpired:
                     continue # Continue loop if timeout expires
                 except FileNotFoundError:
@@ -1847,152 +2215,137 @@ class TimerApp(QMainWindow):
         
         alarm_thread = threading.Thread(target=sound_loop, args=(sound_path, stop_event), daemon=True)
         alarm_thread.stop_event = stop_event
-        self.timer_threads[timer_index] = alarm_thread
+        self._alarm_thread = alarm_thread
+        self._alarm_owner = timer_id
         alarm_thread.start()
 
-    def stop_timer(self, timer_index):
-        if timer_index < len(self.timers) and self.timers[timer_index]:
-            timer = self.timers[timer_index]
+    def resolve_alarm_sound(self, timer):
+        """Sound file for timer's alarm: its own, else the default, else the bundled one"""
+        for sound_path in (timer.sound_path, self.settings.get("default_sound")):
+            if sound_path and os.path.exists(sound_path):
+                return sound_path
+        return self.alarm_sound
+
+    def resolve_alarm_sounds(self):
+        """Re-resolve every timer's alarm sound after the default sound changes"""
+        for timer in self.timers.values():
+            timer.resolved_sound = self.resolve_alarm_sound(timer)
+
+    def stop_alarm(self, timer_id=None):
+        """Stop the alarm sound if timer_id owns it (any timer when None)"""
+        if self._alarm_thread is None or (timer_id is not None and self._alarm_owner != timer_id):
+            return
+        self._alarm_thread.stop_event.set()
+        self._alarm_thread = None
+        self._alarm_owner = None
+
+    def stop_timer(self, timer_id):
+        if timer_id in self.timers:
+            timer = self.timers[timer_id]
 
-            # Stop the alarm sound thread
-            if timer_index in self.timer_threads and hasattr(self.timer_threads[timer_index], 'stop_event'):
-                self.timer_threads[timer_index].stop_event.set()
+            # Stop the alarm sound
+            self.stop_alarm(timer_id)
 
-            timer['is_ringing'] = False
-            timer['is_paused'] = True  # Mark as stopped
-            timer['has_finished'] = True # Mark as finished
+            timer.is_ringing = False
+            timer.is_paused = True  # Mark as stopped
+            timer.has_finished = True # Mark as finished
             
-            timer['last_interaction'] = time.time()  # <--- Update interaction timestamp
+            timer.last_interaction = time.time()  # <--- Update interaction timestamp
             self.save_timers()
-            self.update_timers_display()
+            self.sync_clocks()
+            self.refresh_display()
 
-    def delete_timer(self, timer_index):
+    def delete_timer(self, timer_id):
         """Delete a timer after confirmation."""
-        if timer_index < len(self.timers) and self.timers[timer_index]:
-            timer = self.timers[timer_index]
+        if timer_id in self.timers:
+            timer = self.timers[timer_id]
             
             # Create styled message box
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle('Delete Timer')
-            msg_box.setText(f"Are you sure you want to delete the timer '{timer['name']}'?")
+            msg_box.setText(f"Are you sure you want to delete the timer '{timer.name}'?")
             msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
             msg_box.setDefaultButton(QMessageBox.No)
             
             # Apply theme to message box
-            is_dark = detect_system_theme()
-            apply_theme_to_widget(msg_box, is_dark)
+            apply_theme_to_widget(msg_box, self._is_dark)
             
             reply = msg_box.exec_()
 
             if reply == QMessageBox.Yes:
-                # Stop the alarm sound thread if it's running
-                if timer_index in self.timer_threads and hasattr(self.timer_threads[timer_index], 'stop_event'):
-                    self.timer_threads[timer_index].stop_event.set()
-
-                # Clean up resources
-                if timer_index in self.media_players:
-                    self.media_players[timer_index].stop()
-                    del self.media_players[timer_index]
-                
-                # Use a more robust way to clean up thread-related resources
-                event = self.timer_events.pop(timer_index, None)
-                if event:
-                    event.set() # Signal waiting threads to exit
-
-                thread = self.timer_threads.pop(timer_index, None)
-                if thread and thread.is_alive():
-                    if hasattr(thread, 'stop_event'):
-                        thread.stop_event.set()
-
-                # Remove the timer from the list completely
-                self.timers.pop(timer_index)
+                # Stop the alarm sound if it's this timer's
+                self.stop_alarm(timer_id)
+
+                # Remove the timer completely
+                del self.timers[timer_id]
                 
-                # Update indices for remaining threads and events
-                self.reindex_timer_resources(timer_index)
+                # Pick a new active timer if this one was it
+                self.reindex_timer_resources(timer_id)
                 
                 self.save_timers()
-                self.update_timers_display()
-
-    def reindex_timer_resources(self, deleted_index):
-        """Reindex timer resources after deletion to maintain consistency."""
-        # Create new dictionaries with updated indices
-        new_timer_events = {}
-        new_timer_threads = {}
-        new_media_players = {}
-        
-        for old_index in list(self.timer_events.keys()):
-            if old_index > deleted_index:
-                new_index = old_index - 1
-                new_timer_events[new_index] = self.timer_events[old_index]
-            elif old_index < deleted_index:
-                new_timer_events[old_index] = self.timer_events[old_index]
-        
-        for old_index in list(self.timer_threads.keys()):
-            if old_index > deleted_index:
-                new_index = old_index - 1
-                new_timer_threads[new_index] = self.timer_threads[old_index]
-            elif old_index < deleted_index:
-                new_timer_threads[old_index] = self.timer_threads[old_index]
-        
-        for old_index in list(self.media_players.keys()):
-            if old_index > deleted_index:
-                new_index = old_index - 1
-                new_media_players[new_index] = self.media_players[old_index]
-            elif old_index < deleted_index:
-                new_media_players[old_index] = self.media_players[old_index]
-        
-        # Replace the dictionaries
-        self.timer_events = new_timer_events
-        self.timer_threads = new_timer_threads
-        self.media_players = new_media_players
-        
-        # Update current_primary_timer_index if needed
-        if self.current_primary_timer_index > deleted_index:
-            self.current_primary_timer_index -= 1
-        elif self.current_primary_timer_index == deleted_index:
+                self.sync_clocks()
+                self.refresh_display()
+
+    def reindex_timer_resources(self, deleted_id):
+        """Pick a new primary timer after the current one is deleted."""
+        if self.current_primary_timer_id == deleted_id:
             # If the current primary timer was deleted, find a new one
-            running_indices = self.get_running_timer_indices()
-            if running_indices:
-                self.current_primary_timer_index = running_indices[0]
+            running_ids = self.get_running_timer_ids()
+            if running_ids:
+                self.current_primary_timer_id = running_ids[0]
             else:
-                self.current_primary_timer_index = 0
+                self.current_primary_timer_id = None
+
+    def is_display_hidden(self):
+        """Whether the window can't be seen, so refreshing its widgets is wasted work"""
+        return not self.isVisible() or self.isMinimized()
+
+    def refresh_display(self):
+        """Bring the whole display up to date without waiting for the clocks"""
+        self.tick()
+        self.update_timers_display()
+        self.update_timer_labels()
 
     def update_timers_display(self):
         """Update the list of timers and the large display."""
+        # Timers keep counting and ringing while hidden; the display catches up on restore
+        if self.is_display_hidden():
+            return
+        
         # Update the large timer display
         self.update_large_timer_display()
 
         # Get current timer count and sorted order
-        current_timer_count = len([t for t in self.timers if t is not None])
+        current_timer_count = len(self.timers)
         sorted_timer_pairs = self.sort_timers_by_priority()
-        current_sorted_indices = [i for _, i in sorted_timer_pairs]
+        current_sorted_ids = [i for _, i in sorted_timer_pairs]
 
         # Only rebuild if timer count or order changed
-        if not hasattr(self, "_last_sorted_indices") or \
+        if not hasattr(self, "_last_sorted_ids") or \
            self.last_timer_count != current_timer_count or \
-           self._last_sorted_indices != current_sorted_indices:
+           self._last_sorted_ids != current_sorted_ids:
             self.last_timer_count = current_timer_count
-            self._last_sorted_indices = current_sorted_indices
+            self._last_sorted_ids = current_sorted_ids
             self.rebuild_timers_list()
         # Otherwise, just update labels (handled by update_timer_labels_timer)
 
     def get_timer_priority(self, timer):
         """Get priority for timer sorting (lower number = higher priority)"""
-        if timer["is_ringing"]:
+        if timer.is_ringing:
             return 0  # Highest priority - ringing timers
-        elif not timer.get("has_finished", False) and not timer.get("is_paused", False):
+        elif not timer.has_finished and not timer.is_paused:
             return 1  # Running timers
-        elif timer.get("is_paused", False):
+        elif timer.is_paused:
             return 2  # Paused timers
         else:
             return 3  # Finished timers (lowest priority)
 
     def sort_timers_by_priority(self):
         """Sort timers by priority and last interaction (most recent first)"""
-        timer_pairs = [(timer, i) for i, timer in enumerate(self.timers) if timer is not None]
+        timer_pairs = [(timer, timer_id) for timer_id, timer in self.timers.items()]
         timer_pairs.sort(key=lambda x: (
             self.get_timer_priority(x[0]),
-            -x[0].get("last_interaction", 0)  # <--- Sort by most recent interaction
+            -x[0].last_interaction  # <--- Sort by most recent interaction
         ))
         return timer_pairs
     
@@ -2002,18 +2355,31 @@ class TimerApp(QMainWindow):
         scroll_bar = self.timers_list.verticalScrollBar()
         current_scroll_position = scroll_bar.value()
 
+        # Pull the cards out of their row holders so clear() only deletes the holders
+        for row in range(self.timers_list.count()):
+            holder = self.timers_list.itemWidget(self.timers_list.item(row))
+            card_widget = holder.findChild(QWidget, "timerCard") if holder else None
+            if card_widget is None:
+                continue
+            card_widget.setParent(None)
+            if len(self._row_pool) < 32:
+                self._row_pool.append(card_widget)
+            else:
+                card_widget.deleteLater()
+
         # Update the list of all timers with priority sorting
         self.timers_list.clear()
         
         # Get sorted timers by priority
         sorted_timer_pairs = self.sort_timers_by_priority()
         
-        for timer, original_index in sorted_timer_pairs:
+        for timer, timer_id in sorted_timer_pairs:
             item = QListWidgetItem(self.timers_list)
-            card_widget, time_label, status_label, pause_btn = self.create_timer_card(timer, original_index)
-            # Retrieve icon_label and status_icon_label from the timer card's children
-            icon_label = card_widget.findChild(QLabel, "timerIcon")
-            status_icon_label = card_widget.findChild(QLabel, "statusIcon")
+            if self._row_pool:
+                card_widget = self._row_pool.pop()
+                self.bind_timer_card(card_widget, timer, timer_id)
+            else:
+                card_widget = self.create_timer_card(timer, timer_id)[0]
 
             # Ensure proper sizing for smooth scrolling
             card_widget.adjustSize()
@@ -2025,15 +2391,21 @@ class TimerApp(QMainWindow):
                 size_hint.setHeight(120)
             item.setSizeHint(size_hint)
             
-            self.timers_list.setItemWidget(item, card_widget)
+            # The list deletes its item widgets, so each card sits in a throwaway holder
+            holder = QWidget()
+            holder_layout = QVBoxLayout(holder)
+            holder_layout.setContentsMargins(0, 0, 0, 0)
+            self.timers_list.setItemWidget(item, holder)
+            holder_layout.addWidget(card_widget)
+            card_widget.show()
             
             # Store dynamic labels for updates
-            timer["ui_widgets"] = {
-                "time_label": time_label,
-                "status_label": status_label,
-                "pause_btn": pause_btn,
-                "icon_label": icon_label,
-                "status_icon_label": status_icon_label
+            timer.ui_widgets = {
+                "time_label": card_widget.time_label,
+                "status_label": card_widget.status_label,
+                "pause_btn": card_widget.pause_btn,
+                "icon_label": card_widget.icon_label,
+                "status_icon_label": card_widget.status_icon_label
             }
 
         # Process pending events to ensure proper layout
@@ -2050,186 +2422,162 @@ class TimerApp(QMainWindow):
 
     def update_timer_labels(self):
         """Update only the time labels without rebuilding the list."""
-        for timer in self.timers:
-            if timer and "ui_widgets" in timer:
-                ui_widgets = timer["ui_widgets"]
-                if "time_label" in ui_widgets and ui_widgets["time_label"]:
-                    try:
-                        # Always show remaining | original
-                        ui_widgets["time_label"].setText(
-                            f"{self.format_time(timer['remaining_seconds'])} | {self.format_time(timer['total_seconds'])}"
-                            )
-                        # Update status label with consistent colors and correct ringing display
-                        if "status_label" in ui_widgets and ui_widgets["status_label"]:
-                            status_label = ui_widgets["status_label"]
-                            status_icon_label = None
-
-                            if timer.get("is_ringing", False):
-                                status_label.setText("Ringing!")
-                                status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-                                if "status_icon_label" in ui_widgets and ui_widgets["status_icon_label"]:
-                                    ui_widgets["status_icon_label"].setPixmap(self.get_icon("bell").pixmap(24, 24))
-                                if "icon_label" in ui_widgets and ui_widgets["icon_label"]:
-                                    ui_widgets["icon_label"].setPixmap(self.get_icon("bell").pixmap(24, 24))
-                            elif timer.get("has_finished", False):
-                                status_label.setText("Time's Up!")
-                                status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-                                if "status_icon_label" in ui_widgets and ui_widgets["status_icon_label"]:
-                                    ui_widgets["status_icon_label"].setPixmap(self.get_icon("alarm").pixmap(24, 24))
-                                if "icon_label" in ui_widgets and ui_widgets["icon_label"]:
-                                    ui_widgets["icon_label"].setPixmap(self.get_icon("alarm").pixmap(24, 24))
-                            elif timer.get("is_paused", False):
-                                status_label.setText("Paused")
-                                status_label.setStyleSheet("color: #f59e0b; font-weight: 500;")
-                                if "pause_btn" in ui_widgets and ui_widgets["pause_btn"]:
-                                    pause_btn = ui_widgets["pause_btn"]
-                                    if timer.get("is_ringing", False) or timer.get("has_finished", False):
-                                        pause_btn.setIcon(self.get_icon("play"))
-                                        pause_btn.setEnabled(False)
-                                        pause_btn.setStyleSheet("opacity: 0.5; background-color: #6b7280;")
-                                    elif timer.get("is_paused", False):
-                                        pause_btn.setIcon(self.get_icon("play"))
-                                        pause_btn.setEnabled(True)
-                                        pause_btn.setStyleSheet("")
-                                    else:
-                                        pause_btn.setIcon(self.get_icon("pause"))
-                                        pause_btn.setEnabled(True)
-                                        pause_btn.setStyleSheet("")
-                            elif timer["remaining_seconds"] > 0:
-                                status_label.setText("Running")
-                                status_label.setStyleSheet("color: #10b981; font-weight: 500;")
-                                if "status_icon_label" in ui_widgets and ui_widgets["status_icon_label"]:
-                                    ui_widgets["status_icon_label"].setPixmap(self.get_icon("play").pixmap(24, 24))
-                                if "icon_label" in ui_widgets and ui_widgets["icon_label"]:
-                                    ui_widgets["icon_label"].setPixmap(self.get_icon("play").pixmap(24, 24))
-                            else:
-                                status_label.setText("Finished")
-                                status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-                                if "status_icon_label" in ui_widgets and ui_widgets["status_icon_label"]:
-                                    ui_widgets["status_icon_label"].setPixmap(self.get_icon("alarm").pixmap(24, 24))
-                                if "icon_label" in ui_widgets and ui_widgets["icon_label"]:
-                                    ui_widgets["icon_label"].setPixmap(self.get_icon("alarm").pixmap(24, 24))
-                    except RuntimeError:
-                        timer.pop("ui_widgets", None)
-
-    def get_primary_timer_index(self):
-        """Get the index of the first non-finished timer."""
-        for i, timer in enumerate(self.timers):
-            if not timer.get("has_finished", False):
-                return i
-        return None
-
-    def get_running_timer_indices(self):
-        """Get list of all running (non-finished) timer indices."""
-        running_indices = []
-        for i, timer in enumerate(self.timers):
-            if timer and not timer.get("has_finished", False):
-                running_indices.append(i)
-        return running_indices
+        if self.is_display_hidden():
+            return
+        
+        for timer in self.timers.values():
+            if timer.ui_widgets is not None:
+                ui_widgets = timer.ui_widgets
+                try:
+                    # Always show remaining | original; only touch the label when it changes
+                    time_text = f"{self.format_time(timer.remaining_seconds)} | {self.format_time(timer.total_seconds)}"
+                    if ui_widgets.get("time_text") != time_text:
+                        ui_widgets["time_text"] = time_text
+                        ui_widgets["time_label"].setText(time_text)
+                    
+                    # Restyle the status label and icons only when the status changes
+                    if timer.is_ringing:
+                        status = "ringing"
+                    elif timer.has_finished:
+                        status = "timesup"
+                    elif timer.is_paused:
+                        status = "paused"
+                    elif timer.remaining_seconds > 0:
+                        status = "running"
+                    else:
+                        status = "finished"
+                    
+                    if ui_widgets.get("status") != status:
+                        ui_widgets["status"] = status
+                        self.apply_card_status(ui_widgets, status)
+                except RuntimeError:
+                    timer.ui_widgets = None
+    
+    def apply_card_status(self, ui_widgets, status):
+        """Set a timer card's status text, color and icons for the given status"""
+        status_label = ui_widgets["status_label"]
+        icon_name = None
+        
+        # Update status label with consistent colors and correct ringing display
+        if status == "ringing":
+            status_label.setText("Ringing!")
+            icon_name = "bell"
+        elif status == "timesup":
+            status_label.setText("Time's Up!")
+            icon_name = "alarm"
+        elif status == "paused":
+            status_label.setText("Paused")
+            pause_btn = ui_widgets.get("pause_btn")
+            if pause_btn:
+                pause_btn.setIcon(self.get_icon("play"))
+                pause_btn.setEnabled(True)
+        elif status == "running":
+            status_label.setText("Running")
+            icon_name = "play"
+        else:
+            status_label.setText("Finished")
+            icon_name = "alarm"
+        set_status_property(status_label, status)
+        
+        if icon_name:
+            pixmap = self.get_icon(icon_name).pixmap(24, 24)
+            for key in ("status_icon_label", "icon_label"):
+                if ui_widgets.get(key):
+                    ui_widgets[key].setPixmap(pixmap)
+
+    def get_running_timer_ids(self):
+        """Get list of all running (non-finished) timer ids."""
+        running_ids = []
+        for timer_id, timer in self.timers.items():
+            if not timer.has_finished:
+                running_ids.append(timer_id)
+        return running_ids
 
     def switch_to_next_timer(self):
         """Switch to the next running timer in the active display."""
-        running_indices = self.get_running_timer_indices()
-        if len(running_indices) <= 1:
+        running_ids = self.get_running_timer_ids()
+        if len(running_ids) <= 1:
             return  # No next timer or only one timer
         
         try:
-            current_pos = running_indices.index(self.current_primary_timer_index)
-            next_pos = (current_pos + 1) % len(running_indices)
-            self.current_primary_timer_index = running_indices[next_pos]
+            current_pos = running_ids.index(self.current_primary_timer_id)
+            next_pos = (current_pos + 1) % len(running_ids)
+            self.current_primary_timer_id = running_ids[next_pos]
         except ValueError:
-            # Current index not in running timers, use first one
-            self.current_primary_timer_index = running_indices[0]
+            # Current id not in running timers, use first one
+            self.current_primary_timer_id = running_ids[0]
+        self.update_large_timer_display()
 
     def switch_to_previous_timer(self):
         """Switch to the previous running timer in the active display."""
-        running_indices = self.get_running_timer_indices()
-        if len(running_indices) <= 1:
+        running_ids = self.get_running_timer_ids()
+        if len(running_ids) <= 1:
             return  # No previous timer or only one timer
         
         try:
-            current_pos = running_indices.index(self.current_primary_timer_index)
-            prev_pos = (current_pos - 1) % len(running_indices)
-            self.current_primary_timer_index = running_indices[prev_pos]
+            current_pos = running_ids.index(self.current_primary_timer_id)
+            prev_pos = (current_pos - 1) % len(running_ids)
+            self.current_primary_timer_id = running_ids[prev_pos]
         except ValueError:
-            # Current index not in running timers, use first one
-            self.current_primary_timer_index = running_indices[0]
+            # Current id not in running timers, use first one
+            self.current_primary_timer_id = running_ids[0]
+        self.update_large_timer_display()
 
     def save_timers(self, force=False):
-        """Save timers to a JSON file, excluding UI widgets."""
-        current_time = time.time()
-        
-        # Throttle saves to avoid excessive I/O, unless forced
-        if not force and (current_time - self.last_save_time) < self.save_threshold:
+        """Mark timers as changed; they are written on the next flush unless forced."""
+        self._timers_dirty = True
+        if force:
+            self.flush_timers()
+    
+    def flush_timers(self):
+        """Save timers to a JSON file, excluding UI widgets, if anything changed."""
+        if not self._timers_dirty:
             return
         
         timers_to_save = []
-        for timer in self.timers:
-            if timer is not None:  # Skip None timers
-                # Create a copy and remove non-serializable items
-                t_copy = timer.copy()
-                t_copy.pop("ui_widgets", None)
-                timers_to_save.append(t_copy)
+        for timer in self.timers.values():
+            timers_to_save.append(timer.to_dict())
             
-        with open(self.state_file, "w") as f:
-            json.dump(timers_to_save, f, indent=4)
+        # Timers are the state users can't recreate, so fsync before the rename;
+        # the file stays indented so it can be read and edited by hand
+        _atomic_write(self.state_file, _dumps(timers_to_save, indent=True), fsync=True)
         
-        self.last_save_time = current_time
+        self._timers_dirty = False
 
     def load_timers(self):
         """Load timers from a JSON file."""
         if os.path.exists(self.state_file) and self.settings.get("auto_start_timers", True):
-            with open(self.state_file, "r") as f:
-                loaded_timers = json.load(f)
+            with open(self.state_file, "rb") as f:
+                loaded_timers = _loads(f.read())
                 
-            # Clear existing timers and load saved ones
-            self.timers = loaded_timers
-            
-            # Update timing information for loaded timers
+            # Clear existing timers and load saved ones, numbered in saved (newest first) order
             current_time = time.time()
-            for timer in self.timers:
-                if timer is None:
-                    continue
-                
-                # Initialize timing fields if they don't exist (for backward compatibility)
-                if "start_time" not in timer:
-                    timer["start_time"] = current_time
-                if "pause_time" not in timer:
-                    timer["pause_time"] = None
-                if "total_paused_duration" not in timer:
-                    timer["total_paused_duration"] = 0
+            self.timers = {i: TimerState.from_dict(timer, current_time)
+                           for i, timer in enumerate(loaded_timers) if timer is not None}
+            self._next_timer_id = len(loaded_timers)
+            
+            # Resolve alarm sounds and update timing information for loaded timers
+            for timer in self.timers.values():
+                timer.resolved_sound = self.resolve_alarm_sound(timer)
                 
                 # If timer was paused, update pause_time to current time
-                if timer.get("is_paused", False) and timer.get("pause_time") is None:
-                    timer["pause_time"] = current_time
-                
-            # Restart any running timers
-            for i, timer in enumerate(self.timers):
-                if timer is None:
-                    continue
-                
-                # Create threading event for each timer
-                self.timer_events[i] = threading.Event()
+                if timer.is_paused and timer.pause_time is None:
+                    timer.pause_time = current_time
                 
+            # Running timers get their deadlines queued; ringing ones restart their alarm
+            for timer_id, timer in self.timers.items():
                 # If timer has finished, do not restart it automatically
-                if timer.get("has_finished", False):
+                if timer.has_finished:
                     continue
 
                 # Resume paused timers in paused state
-                if timer.get("is_paused", False):
+                if timer.is_paused:
                     continue
-                elif timer["remaining_seconds"] > 0 and not timer["is_ringing"]:
-                    # Start running timers
-                    timer_thread = threading.Thread(
-                        target=self.run_timer,
-                        args=(i,),
-                        daemon=True
-                    )
-                    self.timer_threads[i] = timer_thread
-                    timer_thread.start()
-                elif timer["is_ringing"]:
+                elif timer.is_ringing:
                     # Restart ringing timers
-                    self.play_alarm(i)
+                    self.play_alarm(timer_id)
+                else:
+                    self.schedule_expiry(timer_id)
     
     def load_settings(self):
         default_settings = {
@@ -2243,46 +2591,57 @@ class TimerApp(QMainWindow):
             "auto_check_updates": True
         }
         
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, "r") as f:
-                    settings = json.load(f)
-                    # Merge with defaults for any missing keys
-                    for key, value in default_settings.items():
-                        if key not in settings:
-                            settings[key] = value
-                    return settings
-            except Exception:
-                return default_settings
-        else:
+        # Snapshot of the file as read, so unchanged settings are never rewritten
+        self._settings_on_disk = None
+        
+        # Opening directly saves a separate exists() check on the common path
+        try:
+            with open(self.settings_file, "rb") as f:
+                settings = _loads(f.read())
+            self._settings_on_disk = dict(settings)
+            # Merge with defaults for any missing keys
+            for key, value in default_settings.items():
+                if key not in settings:
+                    settings[key] = value
+            return settings
+        except Exception:  # Missing (first run) or unreadable file
             return default_settings
     
     def save_settings(self):
-        with open(self.settings_file, "w") as f:
-            json.dump(self.settings, f)
+        self.settings.flush()
     
     def closeEvent(self, event):
-        # Clean up VLC players
-        for player in self.media_players.values():
-            player.stop()
-        
-        # Stop all alarm threads
-        for thread in self.timer_threads.values():
-            if hasattr(thread, 'stop_event'):
-                thread.stop_event.set()
-
-        # Resume any paused threads so they can exit
-        for i, timer_event in self.timer_events.items():
-            timer_event.set()
+        # Stop the alarm sound
+        self.stop_alarm()
         
         # Save timers
-        self.save_timers()
+        self.save_timers(force=True)
         
-        # Save settings
+        # Save settings and wait for the write to land
         self.save_settings()
+        self.settings_writer.stop()
         
         event.accept()
 
+    def showEvent(self, event):
+        """Refresh the display skipped while the window was hidden and restart the clocks"""
+        super().showEvent(event)
+        self.refresh_display()
+        self.sync_clocks()
+
+    def hideEvent(self, event):
+        """Stop the display clocks while the window is hidden"""
+        super().hideEvent(event)
+        self.sync_clocks()
+
+    def changeEvent(self, event):
+        """Stop the display clocks while minimized; catch up and restart them on restore"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if not self.isMinimized():
+                self.refresh_display()
+            self.sync_clocks()
+
     def resizeEvent(self, event):
         """Adjust font size based on window size and apply responsive design."""
         base_font_size = 10
@@ -2374,29 +2733,29 @@ class TimerApp(QMainWindow):
                 widget.style().unpolish(widget)
                 widget.style().polish(widget)
 
-    def get_primary_timer_index(self):
-        """Get the index of the primary active timer (first running timer)"""
-        for i, timer in enumerate(self.timers):
-            if timer and not timer.get("has_finished", False):
-                return i
-        return -1
+    def get_primary_timer_id(self):
+        """Get the id of the primary active timer (first running timer)"""
+        for timer_id, timer in self.timers.items():
+            if not timer.has_finished:
+                return timer_id
+        return None
 
     def update_large_timer_display(self):
         """Update the large timer display with the current primary timer"""
         timer = None
         show_active = False
 
-        # Always show the timer at self.current_primary_timer_index if it exists
-        if 0 <= self.current_primary_timer_index < len(self.timers):
-            timer = self.timers[self.current_primary_timer_index]
-            if timer and (not timer.get("has_finished", False) or timer.get("is_ringing", False) or timer.get("is_paused", False)):
+        # Always show the timer at self.current_primary_timer_id if it exists
+        timer = self.timers.get(self.current_primary_timer_id)
+        if timer is not None:
+            if (not timer.has_finished or timer.is_ringing or timer.is_paused):
                 show_active = True
 
         # If not, try to find any running/paused/ringing timer
         if not show_active:
-            for i, t in enumerate(self.timers):
-                if t and (not t.get("has_finished", False) or t.get("is_ringing", False) or t.get("is_paused", False)):
-                    self.current_primary_timer_index = i
+            for timer_id, t in self.timers.items():
+                if not t.has_finished or t.is_ringing or t.is_paused:
+                    self.current_primary_timer_id = timer_id
                     timer = t
                     show_active = True
                     break
@@ -2405,96 +2764,103 @@ class TimerApp(QMainWindow):
             self.active_timer_frame.setVisible(True)
             self.active_timer_placeholder.setVisible(False)
             # Update navigation button states
-            self.large_prev_button.setEnabled(len(self.get_running_timer_indices()) > 1)
-            self.large_next_button.setEnabled(len(self.get_running_timer_indices()) > 1)
+            self.large_prev_button.setEnabled(len(self.get_running_timer_ids()) > 1)
+            self.large_next_button.setEnabled(len(self.get_running_timer_ids()) > 1)
             
             # Update display
-            self.large_timer_name.setText(timer["name"])
-            if timer.get("description"):
-                self.large_timer_description.setText(timer["description"])
+            self.large_timer_name.setText(timer.name)
+            if timer.description:
+                self.large_timer_description.setText(timer.description)
                 self.large_timer_description.setVisible(True)
             else:
                 self.large_timer_description.setVisible(False)
             
             # Format time display
-            remaining = timer["remaining_seconds"]
+            remaining = timer.remaining_seconds
             hours = remaining // 3600
             minutes = (remaining % 3600) // 60
             seconds = remaining % 60
             
-            if timer["is_ringing"] or timer.get("has_finished", False):
+            if timer.is_ringing or timer.has_finished:
                 time_text = "Time's Up"
             elif hours > 0:
                 time_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
             else:
                 time_text = f"{minutes:02d}:{seconds:02d}"
             
-            self.large_timer_time.setText(time_text)
+            if time_text != self._large_time_text:
+                self._large_time_text = time_text
+                self.large_timer_time.setText(time_text)
             
-        # Update status icon and label
-            if timer["is_ringing"]:
-                self.large_status_icon.setPixmap(self.get_icon("bell").pixmap(28, 28))
-                self.large_timer_status.setText("Ringing!")
-                self.large_timer_status.setStyleSheet("color: #ef4444; font-weight: bold; font-size: 18px;")
-            elif timer.get("has_finished", False):
-                self.large_status_icon.setPixmap(self.get_icon("alarm").pixmap(28, 28))
-                self.large_timer_status.setText("Time's Up!")
-                self.large_timer_status.setStyleSheet("color: #ef4444; font-weight: bold; font-size: 18px;")
-            elif timer.get("is_paused", False):
-                self.large_status_icon.setPixmap(self.get_icon("pause").pixmap(28, 28))
-                self.large_timer_status.setText("Paused")
-                self.large_timer_status.setStyleSheet("color: #f59e0b; font-weight: 500; font-size: 18px;")
-            else:
-                self.large_status_icon.setPixmap(self.get_icon("play").pixmap(28, 28))
-                self.large_timer_status.setText("Running")
-                self.large_timer_status.setStyleSheet("color: #10b981; font-weight: 500; font-size: 18px;")
-
-            # Update status icon and label
-            if timer["is_ringing"]:
-                self.large_status_icon.setPixmap(self.get_icon("bell").pixmap(28, 28))
-                self.large_timer_status.setText("Ringing!")
-                self.large_timer_status.setStyleSheet("color: #ef4444; font-weight: bold; font-size: 18px;")
-                self.large_pause_button.setIcon(self.get_icon("play"))
-                self.large_pause_button.setText("Resume")
-                self.large_pause_button.setEnabled(False)
-                self.large_pause_button.setStyleSheet("opacity: 0.5; background-color: #6b7280;")
-            elif timer.get("has_finished", False):
-                self.large_status_icon.setPixmap(self.get_icon("alarm").pixmap(28, 28))
-                self.large_timer_status.setText("Time's Up!")
-                self.large_timer_status.setStyleSheet("color: #ef4444; font-weight: bold; font-size: 18px;")
-                self.large_pause_button.setIcon(self.get_icon("play"))
-                self.large_pause_button.setText("Resume")
-                self.large_pause_button.setEnabled(False)
-                self.large_pause_button.setStyleSheet("opacity: 0.5; background-color: #6b7280;")
-            elif timer.get("is_paused", False):
-                self.large_status_icon.setPixmap(self.get_icon("pause").pixmap(28, 28))
-                self.large_timer_status.setText("Paused")
-                self.large_timer_status.setStyleSheet("color: #f59e0b; font-weight: 500; font-size: 18px;")
-                self.large_pause_button.setIcon(self.get_icon("play"))
-                self.large_pause_button.setText("Resume")
-                self.large_pause_button.setEnabled(True)
-                self.large_pause_button.setStyleSheet("")
+            # Restyle the status row only when the shown status changes
+            if timer.is_ringing:
+                status = "ringing"
+            elif timer.has_finished:
+                status = "timesup"
+            elif timer.is_paused:
+                status = "paused"
             else:
-                self.large_status_icon.setPixmap(self.get_icon("play").pixmap(28, 28))
-                self.large_timer_status.setText("Running")
-                self.large_timer_status.setStyleSheet("color: #10b981; font-weight: 500; font-size: 18px;")
-                self.large_pause_button.setIcon(self.get_icon("pause"))
-                self.large_pause_button.setText("Pause")
-                self.large_pause_button.setEnabled(True)
-                self.large_pause_button.setStyleSheet("")
+                status = "running"
+            
+            if status != self._large_status:
+                if status == "ringing":
+                    self.large_status_icon.setPixmap(self.get_icon("bell").pixmap(28, 28))
+                    self.large_timer_status.setText("Ringing!")
+                    self.large_pause_button.setIcon(self.get_icon("play"))
+                    self.large_pause_button.setText("Resume")
+                    self.large_pause_button.setEnabled(False)
+                elif status == "timesup":
+                    self.large_status_icon.setPixmap(self.get_icon("alarm").pixmap(28, 28))
+                    self.large_timer_status.setText("Time's Up!")
+                    self.large_pause_button.setIcon(self.get_icon("play"))
+                    self.large_pause_button.setText("Resume")
+                    self.large_pause_button.setEnabled(False)
+                elif status == "paused":
+                    self.large_status_icon.setPixmap(self.get_icon("pause").pixmap(28, 28))
+                    self.large_timer_status.setText("Paused")
+                    self.large_pause_button.setIcon(self.get_icon("play"))
+                    self.large_pause_button.setText("Resume")
+                    self.large_pause_button.setEnabled(True)
+                else:
+                    self.large_status_icon.setPixmap(self.get_icon("play").pixmap(28, 28))
+                    self.large_timer_status.setText("Running")
+                    self.large_pause_button.setIcon(self.get_icon("pause"))
+                    self.large_pause_button.setText("Pause")
+                    self.large_pause_button.setEnabled(True)
+                set_status_property(self.large_timer_status, status)
+                self._large_status = status
 
         else:
             self.active_timer_frame.setVisible(False)
             self.active_timer_placeholder.setVisible(True)
         
         # Update navigation button states
-        self.large_prev_button.setEnabled(len(self.get_running_timer_indices()) > 1)
-        self.large_next_button.setEnabled(len(self.get_running_timer_indices()) > 1)
+        self.large_prev_button.setEnabled(len(self.get_running_timer_ids()) > 1)
+        self.large_next_button.setEnabled(len(self.get_running_timer_ids()) > 1)
         
 
+# Common timer presets as (label, hours, minutes, seconds, grid row, grid column)
+_PRESETS = (
+    ("5 min", 0, 5, 0, 0, 0), ("10 min", 0, 10, 0, 0, 1), ("15 min", 0, 15, 0, 0, 2),
+    ("30 min", 0, 30, 0, 1, 0), ("1 hour", 1, 0, 0, 1, 1), ("2 hours", 2, 0, 0, 1, 2)
+)
+
+
 class TimerCreationDialog(QDialog):
     """Modal dialog for creating new timers"""
     
+    # Shape of get_timer_data's result; copying it presizes the dict
+    _RESULT_TEMPLATE = {
+        "name": "",
+        "total_seconds": 0,
+        "remaining_seconds": 0,
+        "is_ringing": False,
+        "sound_path": "",
+        "description": "",
+        "is_paused": False,
+        "has_finished": False
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Create New Timer")
@@ -2504,6 +2870,13 @@ class TimerCreationDialog(QDialog):
         self.current_description = ""
         self.current_sound = ""
         
+        # Duration fields parsed as they are edited
+        self._hours = self._minutes = self._seconds = 0
+        
+        # Filled in by validate_and_accept for get_timer_data
+        self._name = ""
+        self._total_seconds = 0
+        
         # Apply theme before setting up UI
         is_dark = detect_system_theme()
         apply_theme_to_widget(self, is_dark)
@@ -2541,6 +2914,8 @@ class TimerCreationDialog(QDialog):
         self.hours_input = QLineEdit()
         self.hours_input.setPlaceholderText("0")
         self.hours_input.setText("0")
+        self.hours_input.setValidator(QIntValidator(0, 999, self))
+        self.hours_input.textChanged.connect(self._on_hours_changed)
         self.hours_input.setMaximumWidth(80)
         duration_layout.addWidget(hours_label, 0, 0)
         duration_layout.addWidget(self.hours_input, 0, 1)
@@ -2550,6 +2925,8 @@ class TimerCreationDialog(QDialog):
         self.minutes_input = QLineEdit()
         self.minutes_input.setPlaceholderText("0")
         self.minutes_input.setText("0")
+        self.minutes_input.setValidator(QIntValidator(0, 59, self))
+        self.minutes_input.textChanged.connect(self._on_minutes_changed)
         self.minutes_input.setMaximumWidth(80)
         duration_layout.addWidget(minutes_label, 0, 2)
         duration_layout.addWidget(self.minutes_input, 0, 3)
@@ -2559,6 +2936,8 @@ class TimerCreationDialog(QDialog):
         self.seconds_input = QLineEdit()
         self.seconds_input.setPlaceholderText("0")
         self.seconds_input.setText("0")
+        self.seconds_input.setValidator(QIntValidator(0, 59, self))
+        self.seconds_input.textChanged.connect(self._on_seconds_changed)
         self.seconds_input.setMaximumWidth(80)
         duration_layout.addWidget(seconds_label, 1, 0)
         duration_layout.addWidget(self.seconds_input, 1, 1)
@@ -2574,17 +2953,10 @@ class TimerCreationDialog(QDialog):
         presets_layout = QGridLayout()
         presets_layout.setSpacing(8)
         
-        # Common timer presets
-        presets = [
-            ("5 min", 0, 5, 0), ("10 min", 0, 10, 0), ("15 min", 0, 15, 0),
-            ("30 min", 0, 30, 0), ("1 hour", 1, 0, 0), ("2 hours", 2, 0, 0)
-        ]
-        
-        for i, (label, hours, minutes, seconds) in enumerate(presets):
+        for label, hours, minutes, seconds, row, col in _PRESETS:
             preset_btn = QPushButton(label)
             preset_btn.setObjectName("secondaryButton")
-            preset_btn.clicked.connect(lambda checked, h=hours, m=minutes, s=seconds: self.set_preset_time(h, m, s))
-            row, col = divmod(i, 3)
+            preset_btn.clicked.connect(functools.partial(self.set_preset_time, hours, minutes, seconds))
             presets_layout.addWidget(preset_btn, row, col)
         
         layout.addLayout(presets_layout)
@@ -2594,29 +2966,29 @@ class TimerCreationDialog(QDialog):
         options_label.setObjectName("subtitleLabel")
         layout.addWidget(options_label)
         
+        # Description and sound rows share one grid: button, then its status
+        options_layout = QGridLayout()
+        
         # Description button
-        description_layout = QHBoxLayout()
         self.description_button = QPushButton(" Add Description")
         self.description_button.setIcon(self.parent().get_icon('edit'))
         self.description_button.clicked.connect(self.add_description)
-        description_layout.addWidget(self.description_button)
+        options_layout.addWidget(self.description_button, 0, 0)
         
         self.description_status = QLabel("No description")
         self.description_status.setObjectName("statusLabel")
-        description_layout.addWidget(self.description_status)
-        layout.addLayout(description_layout)
+        options_layout.addWidget(self.description_status, 0, 1)
         
         # Sound selection
-        sound_layout = QHBoxLayout()
         self.sound_button = QPushButton(" Select Sound")
         self.sound_button.setIcon(self.parent().get_icon('sound'))
         self.sound_button.clicked.connect(self.select_sound)
-        sound_layout.addWidget(self.sound_button)
+        options_layout.addWidget(self.sound_button, 1, 0)
         
         self.sound_status = QLabel("Default sound")
         self.sound_status.setObjectName("statusLabel")
-        sound_layout.addWidget(self.sound_status)
-        layout.addLayout(sound_layout)
+        options_layout.addWidget(self.sound_status, 1, 1)
+        layout.addLayout(options_layout)
         
         layout.addStretch()
         
@@ -2629,11 +3001,15 @@ class TimerCreationDialog(QDialog):
         layout.addWidget(button_box)
     
     def set_preset_time(self, hours, minutes, seconds):
-        """Set preset time values"""
-        self.hours_input.setText(str(hours))
-        self.minutes_input.setText(str(minutes))
-        self.seconds_input.setText(str(seconds))
-    
+        """Set preset time values; they are known to be valid, so skip re-parsing them"""
+        self._hours, self._minutes, self._seconds = hours, minutes, seconds
+        for line_edit, value in ((self.hours_input, hours), (self.minutes_input, minutes),
+                                 (self.seconds_input, seconds)):
+            line_edit.blockSignals(True)
+            line_edit.setText(str(value))
+            line_edit.blockSignals(False)
+    
+    @pyqtSlot()
     def add_description(self):
         dialog = TimerDescriptionDialog(self.current_description, self)
         if dialog.exec_() == QDialog.Accepted:
@@ -2641,6 +3017,7 @@ class TimerCreationDialog(QDialog):
             status_text = "Description added" if self.current_description else "No description"
             self.description_status.setText(status_text)
     
+    @pyqtSlot()
     def select_sound(self):
         dialog = SoundSelectionDialog(self.current_sound, self)
         if dialog.exec_() == QDialog.Accepted:
@@ -2648,74 +3025,100 @@ class TimerCreationDialog(QDialog):
             status_text = os.path.basename(self.current_sound) if self.current_sound else "Default sound"
             self.sound_status.setText(status_text)
     
+    @staticmethod
+    def _parse_duration(text):
+        """A duration field's value, or -1 for input that isn't a number yet"""
+        try:
+            return int(text) if text else 0
+        except ValueError:
+            return -1
+    
+    @pyqtSlot(str)
+    def _on_hours_changed(self, text):
+        self._hours = self._parse_duration(text)
+    
+    @pyqtSlot(str)
+    def _on_minutes_changed(self, text):
+        self._minutes = self._parse_duration(text)
+    
+    @pyqtSlot(str)
+    def _on_seconds_changed(self, text):
+        self._seconds = self._parse_duration(text)
+    
+    @pyqtSlot()
     def validate_and_accept(self):
         """Validate input and accept dialog"""
         name = self.timer_name_input.text().strip()
         
-        if not name:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a timer name.")
-            return
+        # Calculate total duration in seconds
+        total_seconds = self._hours * 3600 + self._minutes * 60 + self._seconds
         
-        try:
-            hours = int(self.hours_input.text() or "0")
-            minutes = int(self.minutes_input.text() or "0")
-            seconds = int(self.seconds_input.text() or "0")
-            
-            # Validate inputs
-            if hours < 0 or minutes < 0 or seconds < 0:
-                raise ValueError("Negative values not allowed")
-            if minutes >= 60 or seconds >= 60:
-                raise ValueError("Minutes and seconds must be less than 60")
-            
-            # Calculate total duration in seconds
-            total_seconds = hours * 3600 + minutes * 60 + seconds
-            
-            if total_seconds <= 0:
-                QMessageBox.warning(self, "Invalid Duration", "Please enter a duration greater than 0.")
-                return
-                
-        except (ValueError, TypeError):
-            QMessageBox.warning(self, "Invalid Input", "Please enter valid numbers for hours, minutes, and seconds.")
+        # Find the first problem, if any, and report it with a single message box
+        error = None
+        if not name:
+            error = ("Invalid Input", "Please enter a timer name.")
+        elif self._hours < 0 or not 0 <= self._minutes < 60 or not 0 <= self._seconds < 60:
+            # The validators only let digits in, but still allow in-progress values like "75" or "+"
+            error = ("Invalid Input", "Please enter valid numbers for hours, minutes, and seconds.")
+        elif total_seconds <= 0:
+            error = ("Invalid Duration", "Please enter a duration greater than 0.")
+        
+        if error:
+            QMessageBox.warning(self, *error)
             return
         
+        self._name, self._total_seconds = name, total_seconds
         self.accept()
     
     def get_timer_data(self):
-        """Get the timer data from the dialog"""
-        hours = int(self.hours_input.text() or "0")
-        minutes = int(self.minutes_input.text() or "0")
-        seconds = int(self.seconds_input.text() or "0")
-        total_seconds = hours * 3600 + minutes * 60 + seconds
-        
-        return {
-            "name": self.timer_name_input.text().strip(),
-            "total_seconds": total_seconds,
-            "remaining_seconds": total_seconds,
-            "is_ringing": False,
-            "sound_path": self.current_sound,
-            "description": self.current_description,
-            "is_paused": False,
-            "has_finished": False
-        }
+        """Get the timer data parsed when the dialog was accepted"""
+        timer_data = self._RESULT_TEMPLATE.copy()
+        timer_data["name"] = self._name
+        timer_data["total_seconds"] = timer_data["remaining_seconds"] = self._total_seconds
+        timer_data["sound_path"] = self.current_sound
+        timer_data["description"] = self.current_description
+        return timer_data
 
 
+@functools.lru_cache(maxsize=1)
 def load_and_apply_styles():
-    """Load and apply CSS styles"""
+    """Load and apply CSS styles; read once per process"""
     try:
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        style_file = os.path.join(app_dir, "style.qss")
-        
-        if os.path.exists(style_file):
-            with open(style_file, "r") as f:
-                return f.read()
+        with open(_STYLE_PATH, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"Warning: Could not load styles: {e}")
     
     return ""
 
 
+@functools.lru_cache(maxsize=4)
+def _load_logo(path, size):
+    """Decode and smooth-scale the logo once per (path, size)"""
+    pixmap = QPixmap(path)
+    return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+# Rendered icons keyed by (icon_path, color, size)
+_ICON_CACHE = {}
+
+
 def load_svg_icon(icon_path, color="#374151", size=24):
-    """Load and color an SVG icon"""
+    """Load and color an SVG icon (rendered once per path, color and size)"""
+    key = (icon_path, color, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = _ICON_CACHE[key] = _render_svg_icon(icon_path, color, size)
+    return icon
+
+
+def _render_svg_icon(icon_path, color, size):
+    """Read the SVG from disk, recolor it and rasterize it into a QIcon"""
+    # QtSvg is only needed once the first icon is drawn, not for --version/--help
+    from PyQt5.QtSvg import QSvgRenderer
+    
     try:
         if os.path.exists(icon_path):
             # Read SVG content and replace colors
@@ -2759,8 +3162,7 @@ def load_svg_icon(icon_path, color="#374151", size=24):
 def create_glass_checkbox(text="", checked=False, parent=None):
     """Create a checkbox with proper glass styling and tick marks"""
     from PyQt5.QtWidgets import QCheckBox
-    from PyQt5.QtCore import Qt
-    from PyQt5.QtGui import QPainter, QFont, QColor, QPen, QBrush, QLinearGradient
+    from PyQt5.QtGui import QColor, QPen, QBrush, QLinearGradient
     
     class GlassCheckBox(QCheckBox):
         def __init__(self, text="", parent=None):
@@ -2889,6 +3291,10 @@ def main():
     app.setApplicationVersion(APP_VERSION)
     app.setOrganizationName(APP_DEVELOPER)
     
+    # Detect the theme once; re-detect only when Qt reports a palette change
+    detect_system_theme()
+    app.paletteChanged.connect(invalidate_theme_cache)
+    
     # Load and apply styles
     styles = load_and_apply_styles()
     if styles:
@@ -2898,10 +3304,6 @@ def main():
     window = TimerApp(args)
     window.show()
     
-    # Apply theme to main window
-    is_dark = detect_system_theme()
-    apply_theme_to_widget(window, is_dark)
-    
     # Start the application
     sys.exit(app.exec_())
 